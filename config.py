@@ -1,11 +1,19 @@
 """Configuration management for TodoUI."""
 
+import functools
 import json
+import os
 import sys
+import tempfile
 from pathlib import Path
 from dataclasses import dataclass, asdict, field
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def _get_app_dir() -> Path:
     """Get the application directory, handling both script and frozen executable."""
@@ -25,6 +33,14 @@ DEFAULT_BACKUP_DIR = DEFAULT_DATA_DIR / "backups"
 CONFIG_FILE = APP_DIR / "config.json"
 
 
+@functools.lru_cache(maxsize=8)
+def _load_config_json(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a config file, keyed by stat so re-reads of the unchanged
+    file (reload, tests re-instantiating the singleton) skip the parse."""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
 @dataclass
 class Config:
     """Application configuration."""
@@ -67,8 +83,8 @@ class ConfigManager:
         """Load config from file or create defaults."""
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+                st = os.stat(CONFIG_FILE)
+                data = _load_config_json(str(CONFIG_FILE), st.st_mtime_ns, st.st_size)
                 self._config = Config(**data)
             except Exception:
                 # Any error loading config falls back to defaults
@@ -85,9 +101,34 @@ class ConfigManager:
         Path(self._config.backup_path).mkdir(parents=True, exist_ok=True)
 
     def _save(self) -> None:
-        """Save configuration to file."""
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(asdict(self._config), f, indent=2)
+        """Save configuration to file atomically."""
+        data = asdict(self._config)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode("utf-8")
+
+        # Write to a unique temp file and rename so a crash never leaves
+        # a torn config behind (which would silently reset to defaults).
+        # The name must be unique per write: saves can overlap now that
+        # SettingsWidget runs its save on a pool thread while the GUI
+        # thread may save frame selections, and a shared temp path would
+        # let the writers truncate each other mid-write
+        tmp = tempfile.NamedTemporaryFile(
+            dir=CONFIG_FILE.parent, prefix=CONFIG_FILE.name + ".",
+            suffix=".tmp", delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(payload)
+            os.replace(tmp.name, CONFIG_FILE)
+        except BaseException:
+            # Don't litter the config dir with orphaned temp files
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
 
     @property
     def config(self) -> Config:
@@ -96,9 +137,22 @@ class ConfigManager:
 
     def update(self, **kwargs) -> None:
         """Update configuration values."""
+        self.apply(**kwargs)
+        self._save()
+
+    def apply(self, **kwargs) -> None:
+        """Update configuration values in memory without touching disk.
+
+        For callers that offload the file write to a worker thread:
+        apply first so readers see the new values immediately, then
+        call save() from the worker.
+        """
         for key, value in kwargs.items():
             if hasattr(self._config, key):
                 setattr(self._config, key, value)
+
+    def save(self) -> None:
+        """Write the current configuration to disk."""
         self._save()
 
 
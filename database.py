@@ -1,8 +1,12 @@
 """Database operations for TodoUI."""
 
+import queue
 import sqlite3
-import shutil
+import sys
+import threading
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -10,9 +14,156 @@ from config import Config
 from models import Project, Task
 
 
+@lru_cache(maxsize=4096)
+def _convert_timestamp(value: bytes) -> datetime:
+    """Memoized converter for [timestamp]-aliased columns.
+
+    UI refreshes re-read the same rows over and over, so repeated
+    timestamps become a dict hit instead of a parse. Safe to share
+    results because datetime is immutable.
+    """
+    return datetime.fromisoformat(value.decode())
+
+
+sqlite3.register_converter("timestamp", _convert_timestamp)
+
+
+def _ts_cols(prefix: str, plain: str, stamped: str) -> str:
+    """Column list with [timestamp] aliases so PARSE_COLNAMES readers hand
+    rows back with datetime objects (or None) already in place."""
+    cols = [prefix + c for c in plain.split()]
+    cols += [f'{prefix}{c} AS "{c} [timestamp]"' for c in stamped.split()]
+    return ", ".join(cols)
+
+
+_PROJECT_COLS = _ts_cols("", "id name description is_archived",
+                         "created_at archived_at")
+_TASK_COLS = _ts_cols("", "id project_id title priority is_completed is_deleted",
+                      "due_date created_at completed_at deleted_at")
+_TASK_COLS_T = _ts_cols("t.", "id project_id title priority is_completed is_deleted",
+                        "due_date created_at completed_at deleted_at")
+
+
+# SQL hoisted to module constants so the same string objects are passed to
+# sqlite3 on every call, keeping the connection's statement cache hot
+_SQL_INSERT_PROJECT = "INSERT INTO projects (name, description, created_at) VALUES (?, ?, ?)"
+
+_SQL_SELECT_PROJECTS_ALL = f"SELECT {_PROJECT_COLS} FROM projects ORDER BY name"
+
+_SQL_SELECT_PROJECTS_ACTIVE = f"SELECT {_PROJECT_COLS} FROM projects WHERE is_archived = 0 ORDER BY name"
+
+_SQL_ARCHIVE_PROJECT = "UPDATE projects SET is_archived = 1, archived_at = ? WHERE id = ?"
+
+_SQL_DELETE_PROJECT = "DELETE FROM projects WHERE id = ?"
+
+_SQL_INSERT_TASK = """INSERT INTO tasks (project_id, title, priority, due_date, created_at)
+               VALUES (?, ?, ?, ?, ?)"""
+
+_SQL_SELECT_TASKS = f"""SELECT {_TASK_COLS} FROM tasks
+                   WHERE project_id = ? AND is_deleted = 0
+                   ORDER BY priority, created_at"""
+
+_SQL_SELECT_TASKS_WITH_DELETED = f"SELECT {_TASK_COLS} FROM tasks WHERE project_id = ? ORDER BY priority, created_at"
+
+_SQL_SELECT_TASKS_ACTIVE = f"""SELECT {_TASK_COLS} FROM tasks
+                   WHERE project_id = ? AND is_deleted = 0 AND is_completed = 0
+                   ORDER BY priority, created_at"""
+
+_SQL_SELECT_TASKS_DONE = f"""SELECT {_TASK_COLS} FROM tasks
+                   WHERE project_id = ? AND is_deleted = 0 AND is_completed = 1
+                   ORDER BY priority, created_at"""
+
+_SQL_SELECT_TASKS_DONE_LIMITED = _SQL_SELECT_TASKS_DONE + " LIMIT ?"
+
+_SQL_SELECT_DUE_ALL = f"""SELECT {_TASK_COLS_T} FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.due_date IS NOT NULL
+                     AND t.is_completed = 0
+                     AND t.is_deleted = 0
+                     AND p.is_archived = 0
+                   ORDER BY t.due_date ASC"""
+
+_SQL_SELECT_DUE_PROJECT = f"""SELECT {_TASK_COLS} FROM tasks
+                   WHERE project_id = ?
+                     AND due_date IS NOT NULL
+                     AND is_completed = 0
+                     AND is_deleted = 0
+                   ORDER BY due_date ASC"""
+
+_SQL_SELECT_COMPLETED_ALL = f"""SELECT {_TASK_COLS_T} FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.is_completed = 1
+                     AND t.is_deleted = 0
+                     AND p.is_archived = 0
+                   ORDER BY t.completed_at DESC"""
+
+_SQL_SELECT_COMPLETED_PROJECT = f"""SELECT {_TASK_COLS} FROM tasks
+                   WHERE project_id = ?
+                     AND is_completed = 1
+                     AND is_deleted = 0
+                   ORDER BY completed_at DESC"""
+
+_SQL_SELECT_DUE_ALL_NAMED = f"""SELECT {_TASK_COLS_T}, p.name AS project_name,
+                       strftime('%m/%d/%Y', t.due_date) AS due_str
+                   FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.due_date IS NOT NULL
+                     AND t.is_completed = 0
+                     AND t.is_deleted = 0
+                     AND p.is_archived = 0
+                   ORDER BY t.due_date ASC"""
+
+_SQL_SELECT_DUE_PROJECT_NAMED = f"""SELECT {_TASK_COLS_T}, p.name AS project_name,
+                       strftime('%m/%d/%Y', t.due_date) AS due_str
+                   FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.project_id = ?
+                     AND t.due_date IS NOT NULL
+                     AND t.is_completed = 0
+                     AND t.is_deleted = 0
+                   ORDER BY t.due_date ASC"""
+
+_SQL_SELECT_COMPLETED_ALL_NAMED = f"""SELECT {_TASK_COLS_T}, p.name AS project_name,
+                       strftime('%m/%d/%Y', t.completed_at) AS completed_str
+                   FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.is_completed = 1
+                     AND t.is_deleted = 0
+                     AND p.is_archived = 0
+                   ORDER BY t.completed_at DESC"""
+
+_SQL_SELECT_COMPLETED_PROJECT_NAMED = f"""SELECT {_TASK_COLS_T}, p.name AS project_name,
+                       strftime('%m/%d/%Y', t.completed_at) AS completed_str
+                   FROM tasks t
+                   JOIN projects p ON t.project_id = p.id
+                   WHERE t.project_id = ?
+                     AND t.is_completed = 1
+                     AND t.is_deleted = 0
+                   ORDER BY t.completed_at DESC"""
+
+_SQL_COMPLETE_TASK = "UPDATE tasks SET is_completed = 1, completed_at = ? WHERE id = ?"
+
+_SQL_UNCOMPLETE_TASK = "UPDATE tasks SET is_completed = 0, completed_at = NULL WHERE id = ?"
+
+_SQL_DELETE_TASK = "UPDATE tasks SET is_deleted = 1, deleted_at = ? WHERE id = ?"
+
+
+def _now_iso(_now=datetime.now) -> str:
+    """Current timestamp as ISO-8601 TEXT, with datetime.now bound once."""
+    return _now().isoformat()
+
+
 class DatabaseManager:
     """Manages SQLite database operations."""
 
+    # How long the backup worker waits after a write before snapshotting,
+    # so bursts of writes produce a single backup
+    BACKUP_COALESCE_SECONDS = 30.0
+
+    # Read-only connections kept in a pool; WAL lets them run
+    # concurrently with each other and with the writer
+    READ_POOL_SIZE = 3
+
     def __init__(self, config: Config):
         self.db_path = Path(config.database_path)
         self.backup_path = Path(config.backup_path)
@@ -21,15 +172,70 @@ class DatabaseManager:
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.backup_path.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(str(self.db_path))
+        # check_same_thread off: the manager is constructed on a startup
+        # worker thread, then used from the GUI thread only
+        self.conn = sqlite3.connect(
+            str(self.db_path), cached_statements=256, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        self._apply_pragmas()
         self._create_tables()
 
+        # Reader pool (opened after the schema exists)
+        self._readers: queue.Queue = queue.Queue()
+        for _ in range(self.READ_POOL_SIZE):
+            self._readers.put(self._open_reader())
+
+        # Background backup worker - mutating methods just flag the event
+        self._backup_pending = threading.Event()
+        self._backup_stop = threading.Event()
+        # Last backup failure, cleared by the next success; lets callers
+        # check backup health without watching stderr
+        self.backup_error: Optional[Exception] = None
+        self._backup_thread = threading.Thread(target=self._backup_worker, daemon=True)
+        self._backup_thread.start()
+
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        """Connection-scoped PRAGMAs; these do not persist across opens, so
+        every sqlite3.connect in this class must come through here."""
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    def _apply_pragmas(self) -> None:
+        """Tune the writer connection for fast writes (WAL)."""
+        self._configure(self.conn)
+        # WAL avoids the rollback journal's double-write; synchronous=NORMAL
+        # skips the fsync on every commit (WAL stays durable across app crashes)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA cache_size = -20000")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only pool connection."""
+        conn = sqlite3.connect(
+            str(self.db_path),
+            cached_statements=256,
+            detect_types=sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    @contextmanager
+    def _read_conn(self):
+        """Borrow a reader connection from the pool."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
     def _create_tables(self) -> None:
         """Create database tables if they don't exist."""
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS projects (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -40,7 +246,7 @@ class DatabaseManager:
             )
         """)
 
-        cursor.execute("""
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS tasks (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 project_id INTEGER NOT NULL,
@@ -56,41 +262,97 @@ class DatabaseManager:
             )
         """)
 
-        # Enable foreign keys
-        cursor.execute("PRAGMA foreign_keys = ON")
+        # Composite indexes matched to the hot SELECT predicates; the
+        # partial indexes stay small since most tasks lack a due date and
+        # completed tasks are a minority of the table
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_proj_del_prio
+            ON tasks(project_id, is_deleted, priority, created_at)
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_due
+            ON tasks(is_deleted, is_completed, due_date)
+            WHERE due_date IS NOT NULL
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_tasks_completed
+            ON tasks(is_deleted, is_completed, completed_at DESC)
+            WHERE is_completed = 1
+        """)
+        self.conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_projects_archived
+            ON projects(is_archived, name)
+        """)
 
         self.conn.commit()
 
     def _backup(self) -> None:
-        """Create a timestamped backup of the database."""
+        """Request a backup; the background worker coalesces requests."""
+        self._backup_pending.set()
+
+    def _backup_worker(self) -> None:
+        """Wait for backup requests and snapshot at most once per window."""
+        while not self._backup_stop.is_set():
+            if not self._backup_pending.wait(timeout=1.0):
+                continue
+            # Let a burst of writes settle into a single snapshot
+            self._backup_stop.wait(self.BACKUP_COALESCE_SECONDS)
+            self._backup_pending.clear()
+            # One failed snapshot (disk full, unwritable dir, transient
+            # lock) must not kill the worker and silently end backups
+            try:
+                self._write_backup()
+                self.backup_error = None
+            except Exception as exc:
+                self.backup_error = exc
+                print(f"Backup failed: {exc}", file=sys.stderr)
+
+    def _write_backup(self) -> None:
+        """Create a timestamped backup with VACUUM INTO.
+
+        Produces a compacted, consistent snapshot (free pages are not
+        copied). Opens its own source connection so it is safe to call
+        from the worker thread and never interrupts the live connection.
+        """
         if not self.db_path.exists():
             return
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_path / f"todoui_{timestamp}.db"
+        # VACUUM INTO refuses to overwrite; a stale file with this exact
+        # timestamp can only be a leftover from a failed earlier attempt
+        backup_file.unlink(missing_ok=True)
 
-        # Close connection temporarily for clean backup
-        self.conn.close()
-        shutil.copy2(self.db_path, backup_file)
-        self.conn = sqlite3.connect(str(self.db_path))
-        self.conn.row_factory = sqlite3.Row
+        src = sqlite3.connect(str(self.db_path))
+        try:
+            src.execute("VACUUM INTO ?", (str(backup_file),))
+        finally:
+            src.close()
 
     def close(self) -> None:
-        """Close database connection."""
+        """Close database connection, flushing any pending backup."""
+        self._backup_stop.set()
+        self._backup_thread.join(timeout=10.0)
+        if self._backup_pending.is_set():
+            self._backup_pending.clear()
+            # Shutdown must not raise into the window's closeEvent
+            try:
+                self._write_backup()
+            except Exception as exc:
+                self.backup_error = exc
+                print(f"Final backup failed: {exc}", file=sys.stderr)
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
         self.conn.close()
 
     # Project operations
 
     def create_project(self, name: str, description: Optional[str] = None) -> Project:
         """Create a new project."""
-        now = datetime.now().isoformat()
-        cursor = self.conn.cursor()
+        now = _now_iso()
 
-        cursor.execute(
-            "INSERT INTO projects (name, description, created_at) VALUES (?, ?, ?)",
-            (name, description, now)
-        )
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute(_SQL_INSERT_PROJECT, (name, description, now))
         self._backup()
 
         return Project(
@@ -103,47 +365,27 @@ class DatabaseManager:
 
     def get_projects(self, include_archived: bool = False) -> list[Project]:
         """Get all projects, optionally including archived ones."""
-        cursor = self.conn.cursor()
-
-        if include_archived:
-            cursor.execute("SELECT * FROM projects ORDER BY name")
-        else:
-            cursor.execute("SELECT * FROM projects WHERE is_archived = 0 ORDER BY name")
-
-        projects = []
-        for row in cursor.fetchall():
-            projects.append(Project(
-                id=row["id"],
-                name=row["name"],
-                description=row["description"],
-                is_archived=bool(row["is_archived"]),
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-                archived_at=datetime.fromisoformat(row["archived_at"]) if row["archived_at"] else None
-            ))
-
-        return projects
+        with self._read_conn() as conn:
+            if include_archived:
+                cursor = conn.execute(_SQL_SELECT_PROJECTS_ALL)
+            else:
+                cursor = conn.execute(_SQL_SELECT_PROJECTS_ACTIVE)
+            return [Project.from_row(row) for row in cursor]
 
     def archive_project(self, project_id: int) -> None:
         """Archive a project."""
-        now = datetime.now().isoformat()
-        cursor = self.conn.cursor()
+        now = _now_iso()
 
-        cursor.execute(
-            "UPDATE projects SET is_archived = 1, archived_at = ? WHERE id = ?",
-            (now, project_id)
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_ARCHIVE_PROJECT, (now, project_id))
         self._backup()
 
     def delete_project(self, project_id: int) -> None:
         """Hard delete a project and all its tasks."""
-        cursor = self.conn.cursor()
-
-        # Delete tasks first (or rely on CASCADE)
-        cursor.execute("DELETE FROM tasks WHERE project_id = ?", (project_id,))
-        cursor.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-
-        self.conn.commit()
+        with self.conn:
+            # ON DELETE CASCADE removes the project's tasks in the same
+            # statement (foreign_keys is ON for this connection)
+            self.conn.execute(_SQL_DELETE_PROJECT, (project_id,))
         self._backup()
 
     # Task operations
@@ -156,16 +398,14 @@ class DatabaseManager:
         due_date: Optional[datetime] = None
     ) -> Task:
         """Create a new task."""
-        now = datetime.now().isoformat()
+        now = _now_iso()
         due_str = due_date.isoformat() if due_date else None
-        cursor = self.conn.cursor()
 
-        cursor.execute(
-            """INSERT INTO tasks (project_id, title, priority, due_date, created_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            (project_id, title, priority, due_str, now)
-        )
-        self.conn.commit()
+        with self.conn:
+            cursor = self.conn.execute(
+                _SQL_INSERT_TASK,
+                (project_id, title, priority, due_str, now)
+            )
         self._backup()
 
         return Task(
@@ -179,39 +419,134 @@ class DatabaseManager:
             created_at=datetime.fromisoformat(now)
         )
 
-    def get_tasks(self, project_id: int, include_deleted: bool = False) -> list[Task]:
-        """Get all tasks for a project."""
-        cursor = self.conn.cursor()
+    def create_tasks_bulk(self, tasks: list[dict]) -> None:
+        """Create many tasks in a single transaction with one backup.
 
-        if include_deleted:
-            cursor.execute(
-                "SELECT * FROM tasks WHERE project_id = ? ORDER BY priority, created_at",
-                (project_id,)
-            )
-        else:
-            cursor.execute(
-                """SELECT * FROM tasks
-                   WHERE project_id = ? AND is_deleted = 0
-                   ORDER BY priority, created_at""",
-                (project_id,)
-            )
+        Each dict requires "project_id" and "title"; "priority" and
+        "due_date" are optional.
+        """
+        if not tasks:
+            return
 
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append(Task(
-                id=row["id"],
-                project_id=row["project_id"],
-                title=row["title"],
-                priority=row["priority"],
-                due_date=datetime.fromisoformat(row["due_date"]) if row["due_date"] else None,
-                is_completed=bool(row["is_completed"]),
-                is_deleted=bool(row["is_deleted"]),
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-                deleted_at=datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None
+        now = _now_iso()
+        rows = []
+        for task in tasks:
+            due = task.get("due_date")
+            rows.append((
+                task["project_id"],
+                task["title"],
+                task.get("priority", 0),
+                due.isoformat() if isinstance(due, datetime) else due,
+                now
             ))
 
-        return tasks
+        with self.conn:
+            self.conn.executemany(_SQL_INSERT_TASK, rows)
+        self._backup()
+
+    def complete_tasks_bulk(self, task_ids: list[int]) -> None:
+        """Mark many tasks as completed in a single transaction with one backup."""
+        if not task_ids:
+            return
+
+        now = _now_iso()
+
+        with self.conn:
+            self.conn.executemany(
+                _SQL_COMPLETE_TASK,
+                [(now, task_id) for task_id in task_ids]
+            )
+        self._backup()
+
+    def update_tasks_bulk(self, updates: list[tuple[int, dict]]) -> None:
+        """Update many tasks in a single transaction with one backup.
+
+        Takes (task_id, fields) tuples; fields is a dict as accepted by
+        update_task. Updates sharing the same field set are grouped into
+        one executemany each.
+        """
+        if not updates:
+            return
+
+        allowed_fields = {"title", "priority", "due_date", "is_completed", "is_deleted"}
+
+        # Group rows by their set of updated fields so each shape can be
+        # executed as a single executemany
+        grouped: dict[tuple, list[tuple]] = {}
+        for task_id, fields in updates:
+            keys = tuple(sorted(k for k in fields if k in allowed_fields))
+            if not keys:
+                continue
+            values = []
+            for key in keys:
+                value = fields[key]
+                if key == "due_date" and isinstance(value, datetime):
+                    value = value.isoformat()
+                values.append(value)
+            values.append(task_id)
+            grouped.setdefault(keys, []).append(tuple(values))
+
+        if not grouped:
+            return
+
+        with self.conn:
+            for keys, rows in grouped.items():
+                query = "UPDATE tasks SET {} WHERE id = ?".format(
+                    ", ".join(f"{key} = ?" for key in keys)
+                )
+                self.conn.executemany(query, rows)
+        self._backup()
+
+    def get_tasks(self, project_id: int, include_deleted: bool = False) -> list[Task]:
+        """Get all tasks for a project."""
+        with self._read_conn() as conn:
+            if include_deleted:
+                cursor = conn.execute(_SQL_SELECT_TASKS_WITH_DELETED, (project_id,))
+            else:
+                cursor = conn.execute(_SQL_SELECT_TASKS, (project_id,))
+            return [Task.from_row(row) for row in cursor]
+
+    def get_tasks_partitioned(
+        self,
+        project_id: int,
+        completed_limit: Optional[int] = None
+    ) -> tuple[list[Task], list[Task]]:
+        """Get a project's tasks split into (active, completed) lists.
+
+        Both lists keep the priority/creation order of get_tasks; the
+        split happens in SQL so callers that render the sections
+        separately avoid a Python-side partition pass. completed_limit
+        caps the completed list, which is usually the larger and least
+        looked-at of the two.
+        """
+        with self._read_conn() as conn:
+            cursor = conn.execute(_SQL_SELECT_TASKS_ACTIVE, (project_id,))
+            active = [Task.from_row(row) for row in cursor]
+
+            if completed_limit is None:
+                cursor = conn.execute(_SQL_SELECT_TASKS_DONE, (project_id,))
+            else:
+                cursor = conn.execute(
+                    _SQL_SELECT_TASKS_DONE_LIMITED, (project_id, completed_limit))
+            completed = [Task.from_row(row) for row in cursor]
+
+        return active, completed
+
+    def iter_tasks_with_due_dates(self, project_id: Optional[int] = None):
+        """Stream active tasks with due dates, sorted nearest-first.
+
+        Lazy variant of get_tasks_with_due_dates: rows are fetched and
+        converted as the caller iterates, so the first tasks can be
+        rendered before the full result set is materialized. The pooled
+        connection is held until the generator is exhausted or closed.
+        """
+        with self._read_conn() as conn:
+            if project_id is None:
+                cursor = conn.execute(_SQL_SELECT_DUE_ALL)
+            else:
+                cursor = conn.execute(_SQL_SELECT_DUE_PROJECT, (project_id,))
+            for row in cursor:
+                yield Task.from_row(row)
 
     def get_tasks_with_due_dates(self, project_id: Optional[int] = None) -> list[Task]:
         """Get active tasks with due dates, sorted nearest-first.
@@ -219,45 +554,40 @@ class DatabaseManager:
         When project_id is None, returns tasks from all non-archived projects.
         When project_id is provided, returns tasks from that project only.
         """
-        cursor = self.conn.cursor()
+        return list(self.iter_tasks_with_due_dates(project_id))
 
-        if project_id is None:
-            cursor.execute(
-                """SELECT t.* FROM tasks t
-                   JOIN projects p ON t.project_id = p.id
-                   WHERE t.due_date IS NOT NULL
-                     AND t.is_completed = 0
-                     AND t.is_deleted = 0
-                     AND p.is_archived = 0
-                   ORDER BY t.due_date ASC"""
-            )
-        else:
-            cursor.execute(
-                """SELECT * FROM tasks
-                   WHERE project_id = ?
-                     AND due_date IS NOT NULL
-                     AND is_completed = 0
-                     AND is_deleted = 0
-                   ORDER BY due_date ASC""",
-                (project_id,)
-            )
+    def get_tasks_with_due_dates_named(
+        self, project_id: Optional[int] = None
+    ) -> list[tuple[Task, str, str]]:
+        """Get active tasks with due dates plus display columns.
 
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append(Task(
-                id=row["id"],
-                project_id=row["project_id"],
-                title=row["title"],
-                priority=row["priority"],
-                due_date=datetime.fromisoformat(row["due_date"]) if row["due_date"] else None,
-                is_completed=bool(row["is_completed"]),
-                is_deleted=bool(row["is_deleted"]),
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-                deleted_at=datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None
-            ))
-
-        return tasks
+        Returns (task, project_name, due_str) triples in the same order
+        as get_tasks_with_due_dates. The name comes from the JOIN and
+        due_str is formatted as MM/DD/YYYY by SQLite, so callers need
+        neither a projects lookup nor a per-row strftime.
+        """
+        with self._read_conn() as conn:
+            if project_id is None:
+                cursor = conn.execute(_SQL_SELECT_DUE_ALL_NAMED)
+            else:
+                cursor = conn.execute(_SQL_SELECT_DUE_PROJECT_NAMED, (project_id,))
+            return [
+                (Task.from_row(row), row["project_name"], row["due_str"])
+                for row in cursor
+            ]
+
+    def iter_completed_tasks(self, project_id: Optional[int] = None):
+        """Stream completed tasks, most-recently-completed first.
+
+        Lazy variant of get_completed_tasks; see iter_tasks_with_due_dates.
+        """
+        with self._read_conn() as conn:
+            if project_id is None:
+                cursor = conn.execute(_SQL_SELECT_COMPLETED_ALL)
+            else:
+                cursor = conn.execute(_SQL_SELECT_COMPLETED_PROJECT, (project_id,))
+            for row in cursor:
+                yield Task.from_row(row)
 
     def get_completed_tasks(self, project_id: Optional[int] = None) -> list[Task]:
         """Get completed tasks, sorted most-recently-completed first.
@@ -265,77 +595,49 @@ class DatabaseManager:
         When project_id is None, returns tasks from all non-archived projects.
         When project_id is provided, returns tasks from that project only.
         """
-        cursor = self.conn.cursor()
+        return list(self.iter_completed_tasks(project_id))
 
-        if project_id is None:
-            cursor.execute(
-                """SELECT t.* FROM tasks t
-                   JOIN projects p ON t.project_id = p.id
-                   WHERE t.is_completed = 1
-                     AND t.is_deleted = 0
-                     AND p.is_archived = 0
-                   ORDER BY t.completed_at DESC"""
-            )
-        else:
-            cursor.execute(
-                """SELECT * FROM tasks
-                   WHERE project_id = ?
-                     AND is_completed = 1
-                     AND is_deleted = 0
-                   ORDER BY completed_at DESC""",
-                (project_id,)
-            )
-
-        tasks = []
-        for row in cursor.fetchall():
-            tasks.append(Task(
-                id=row["id"],
-                project_id=row["project_id"],
-                title=row["title"],
-                priority=row["priority"],
-                due_date=datetime.fromisoformat(row["due_date"]) if row["due_date"] else None,
-                is_completed=bool(row["is_completed"]),
-                is_deleted=bool(row["is_deleted"]),
-                created_at=datetime.fromisoformat(row["created_at"]) if row["created_at"] else None,
-                completed_at=datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None,
-                deleted_at=datetime.fromisoformat(row["deleted_at"]) if row["deleted_at"] else None
-            ))
+    def get_completed_tasks_named(
+        self, project_id: Optional[int] = None
+    ) -> list[tuple[Task, str, Optional[str]]]:
+        """Get completed tasks plus display columns.
 
-        return tasks
+        Returns (task, project_name, completed_str) triples; see
+        get_tasks_with_due_dates_named. completed_str is None when the
+        row has no completion timestamp.
+        """
+        with self._read_conn() as conn:
+            if project_id is None:
+                cursor = conn.execute(_SQL_SELECT_COMPLETED_ALL_NAMED)
+            else:
+                cursor = conn.execute(
+                    _SQL_SELECT_COMPLETED_PROJECT_NAMED, (project_id,)
+                )
+            return [
+                (Task.from_row(row), row["project_name"], row["completed_str"])
+                for row in cursor
+            ]
 
     def complete_task(self, task_id: int) -> None:
         """Mark a task as completed."""
-        now = datetime.now().isoformat()
-        cursor = self.conn.cursor()
+        now = _now_iso()
 
-        cursor.execute(
-            "UPDATE tasks SET is_completed = 1, completed_at = ? WHERE id = ?",
-            (now, task_id)
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_COMPLETE_TASK, (now, task_id))
         self._backup()
 
     def uncomplete_task(self, task_id: int) -> None:
         """Mark a task as not completed."""
-        cursor = self.conn.cursor()
-
-        cursor.execute(
-            "UPDATE tasks SET is_completed = 0, completed_at = NULL WHERE id = ?",
-            (task_id,)
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_UNCOMPLETE_TASK, (task_id,))
         self._backup()
 
     def delete_task(self, task_id: int) -> None:
         """Soft delete a task."""
-        now = datetime.now().isoformat()
-        cursor = self.conn.cursor()
+        now = _now_iso()
 
-        cursor.execute(
-            "UPDATE tasks SET is_deleted = 1, deleted_at = ? WHERE id = ?",
-            (now, task_id)
-        )
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(_SQL_DELETE_TASK, (now, task_id))
         self._backup()
 
     def update_task(self, task_id: int, **kwargs) -> None:
@@ -362,7 +664,6 @@ class DatabaseManager:
         values.append(task_id)
         query = f"UPDATE tasks SET {', '.join(updates)} WHERE id = ?"
 
-        cursor = self.conn.cursor()
-        cursor.execute(query, values)
-        self.conn.commit()
+        with self.conn:
+            self.conn.execute(query, values)
         self._backup()
@@ -48,28 +48,36 @@ Note: This module requires a `themes` module that provides:
 
 Legacy aliases (CTkTableRow, CTkTable, etc.) are provided for backwards compatibility.
 
-TODO: Optimization opportunities:
-1. Cache QFont objects at module level instead of creating per-widget:
-   _FONT_13 = QFont(FONT_FAMILY, 13)
-   _FONT_13_BOLD = QFont(FONT_FAMILY, 13, QFont.Weight.Bold)
-2. Cache get_colors() result during batch operations - currently
-   creates a new dict via to_dict() on every call, which happens per-row
-3. Consider passing colors dict to row constructors for bulk operations
+Design note: Table deliberately stays widget-based (one QFrame per row)
+rather than moving to QTableView + QAbstractTableModel. Consumers drive
+it through row widgets (per-row action buttons, update_actions,
+set_selected), which a model/delegate port would break, so hot spots are
+optimized in place instead.
 """
 
+import bisect
+import functools
+import mmap
 import os
 import tempfile
+import weakref
 from contextlib import contextmanager
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, TYPE_CHECKING
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from PyQt6.QtWidgets import (
     QWidget, QFrame, QLabel, QPushButton, QVBoxLayout, QHBoxLayout,
-    QScrollArea, QSizePolicy, QSpacerItem, QButtonGroup, QDialog
+    QScrollArea, QSizePolicy, QSpacerItem, QAbstractButton, QButtonGroup,
+    QDialog
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import QRect, QSize, Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QColor, QFont, QPainter
 
 import json
 
@@ -82,8 +90,34 @@ import json
 # Font configuration
 FONT_FAMILY = "Inter"
 
+# Shared QFont instances (per the optimization TODO above). QFont is
+# implicitly shared (copy-on-write), so handing the same object to many
+# widgets is safe and skips the per-widget allocation + font lookup.
+_font_cache: dict[tuple, "QFont"] = {}
+
+
+def get_font(size: int, weight=None, italic: bool = False) -> "QFont":
+    """Get a shared QFont for the app font family at the given size/style.
+
+    Sharing is safe: QWidget.setFont copies the font, so callers can't
+    mutate each other's entries. Always prefer this over constructing
+    QFont directly; every cache hit skips a font-database lookup. All
+    widget code goes through here already - keep it that way rather
+    than introducing per-view font singletons."""
+    key = (size, weight, italic)
+    font = _font_cache.get(key)
+    if font is None:
+        if weight is None:
+            font = QFont(FONT_FAMILY, size)
+        else:
+            font = QFont(FONT_FAMILY, size, weight)
+        if italic:
+            font.setItalic(True)
+        _font_cache[key] = font
+    return font
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Theme:
     """Represents a complete UI theme."""
 
@@ -148,25 +182,57 @@ class Theme:
             "scrollbar_thumb_hover": self.scrollbar_thumb_hover,
         }
 
+@functools.lru_cache(maxsize=8)
+def _load_themes_json(file_path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a themes file via mmap, with orjson when available.
+
+    mtime_ns/size exist only as cache keys: the same unchanged file is
+    parsed once per process, however many times widgets re-initialize.
+    """
+    with open(file_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                return orjson.loads(memoryview(mm))
+            return json.loads(mm.read())
+
+
 def load_themes_from_json(file_path: str) -> dict[str, Theme]:
-    """Loads themes from a JSON file."""
+    """Loads themes from a JSON file, memoized until the file changes on disk."""
+    st = os.stat(file_path)
+    data = _load_themes_json(file_path, st.st_mtime_ns, st.st_size)
     themes = {}
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-        for name, colors in data["themes"].items():
-            themes[name] = Theme(name=name, **colors)
+    for name, colors in data["themes"].items():
+        themes[name] = Theme(name=name, **colors)
     return themes
 
-# Theme registry
-THEMES = load_themes_from_json('themes.json')
-DARK_THEME = THEMES.get("dark")
+
+# Theme registry, loaded lazily on first access (see _load_themes / __getattr__)
+_themes_cache: Optional[dict[str, Theme]] = None
+
+
+def _load_themes() -> dict[str, Theme]:
+    """Load and cache the theme registry on first use."""
+    global _themes_cache
+    if _themes_cache is None:
+        _themes_cache = load_themes_from_json('themes.json')
+    return _themes_cache
+
+
+def __getattr__(name: str):
+    """Lazy module attributes (PEP 562) so import doesn't parse themes.json."""
+    if name == "THEMES":
+        return _load_themes()
+    if name == "DARK_THEME":
+        return _load_themes().get("dark")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
 # MODULE STATE
 # =============================================================================
 
-_current_theme: Theme = DARK_THEME
+_current_theme: Optional[Theme] = None
+_current_colors: Optional[dict[str, str]] = None
 _theme_change_callbacks: list[Callable[[], None]] = []
 
 
@@ -175,7 +241,10 @@ _theme_change_callbacks: list[Callable[[], None]] = []
 # =============================================================================
 
 def get_current_theme() -> Theme:
-    """Get the currently active theme."""
+    """Get the currently active theme, defaulting to dark on first use."""
+    global _current_theme
+    if _current_theme is None:
+        _current_theme = _load_themes().get("dark")
     return _current_theme
 
 
@@ -183,9 +252,13 @@ def get_colors() -> dict[str, str]:
     """
     Get current theme colors as dictionary.
 
-    This provides backward compatibility with the existing COLORS usage.
+    The dict is built once per active theme (see the optimization TODO
+    above) and shared between callers - treat it as read-only.
     """
-    return _current_theme.to_dict()
+    global _current_colors
+    if _current_colors is None:
+        _current_colors = get_current_theme().to_dict()
+    return _current_colors
 
 
 def get_available_themes() -> list[tuple[str, str]]:
@@ -195,7 +268,7 @@ def get_available_themes() -> list[tuple[str, str]]:
     Returns:
         List of (name, display_name) tuples
     """
-    return [(t.name, t.display_name) for t in THEMES.values()]
+    return [(t.name, t.display_name) for t in _load_themes().values()]
 
 
 def set_theme(theme_name: str) -> Theme:
@@ -211,12 +284,22 @@ def set_theme(theme_name: str) -> Theme:
     Raises:
         ValueError: If theme_name is not found
     """
-    global _current_theme
+    global _current_theme, _current_colors
 
-    if theme_name not in THEMES:
+    themes = _load_themes()
+    if theme_name not in themes:
         raise ValueError(f"Unknown theme: {theme_name}")
 
-    _current_theme = THEMES[theme_name]
+    _current_theme = themes[theme_name]
+    _current_colors = _current_theme.to_dict()
+
+    # Old-theme QSS strings are dead weight now; drop them
+    _button_qss.cache_clear()
+    _card_qss.cache_clear()
+    _stopped_card_qss.cache_clear()
+    _dialog_btn_qss.cache_clear()
+    _tab_button_qss.cache_clear()
+    _scrollbar_qss.cache_clear()
 
     # Notify all registered callbacks
     _notify_theme_change()
@@ -309,37 +392,37 @@ def get_dropdown_arrow_path(color: str) -> str:
     Returns:
         Path to the SVG file, formatted for Qt stylesheets
     """
-    # Check cache first
-    if color in _arrow_svg_cache:
-        path = _arrow_svg_cache[color]
-        if os.path.exists(path):
-            return path.replace('\\', '/')
-
-    # Create SVG content
-    svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" width="12" height="8" viewBox="0 0 12 8">
-<polygon points="0,0 12,0 6,8" fill="{color}"/>
-</svg>'''
+    # Cache hit: the file was written this process, trust it (no stat)
+    cached = _arrow_svg_cache.get(color)
+    if cached is not None:
+        return cached
 
     # Create filename based on color (remove # from hex)
     color_safe = color.replace('#', '')
     filename = f"derby_arrow_{color_safe}.svg"
 
-    # Write to temp directory
+    # Write to temp directory, skipping the write if a previous run left it
     temp_dir = tempfile.gettempdir()
     svg_path = os.path.join(temp_dir, filename)
 
-    with open(svg_path, 'w') as f:
-        f.write(svg_content)
+    if not os.path.exists(svg_path):
+        svg_content = f'''<svg xmlns="http://www.w3.org/2000/svg" width="12" height="8" viewBox="0 0 12 8">
+<polygon points="0,0 12,0 6,8" fill="{color}"/>
+</svg>'''
+        with open(svg_path, 'w') as f:
+            f.write(svg_content)
 
-    # Cache the path
+    # Cache pre-normalized with forward slashes for Qt
+    svg_path = svg_path.replace('\\', '/')
     _arrow_svg_cache[color] = svg_path
 
-    # Return with forward slashes for Qt
-    return svg_path.replace('\\', '/')
+    return svg_path
 
 
-# Track nested batch_update calls per widget
-_update_hold_count: dict[int, int] = {}
+# Track nested batch_update calls per widget. Weak keys mean entries
+# vanish with their widget, so deleted widgets can't leak counts or
+# collide with a recycled id()
+_update_hold_count: "weakref.WeakKeyDictionary[QWidget, int]" = weakref.WeakKeyDictionary()
 
 
 @contextmanager
@@ -364,11 +447,9 @@ def batch_update(widget: 'QWidgetType'):
     Args:
         widget: The PyQt widget to update
     """
-    widget_id = id(widget)
-
     # Increment hold count for this widget
-    prev_count = _update_hold_count.get(widget_id, 0)
-    _update_hold_count[widget_id] = prev_count + 1
+    prev_count = _update_hold_count.get(widget, 0)
+    _update_hold_count[widget] = prev_count + 1
 
     # Disable updates only on outermost call
     if prev_count == 0:
@@ -381,9 +462,9 @@ def batch_update(widget: 'QWidgetType'):
         yield
     finally:
         # Decrement hold count
-        current_count = _update_hold_count.get(widget_id, 1) - 1
+        current_count = _update_hold_count.get(widget, 1) - 1
         if current_count <= 0:
-            _update_hold_count.pop(widget_id, None)
+            _update_hold_count.pop(widget, None)
 
             # Re-enable updates only on outermost call
             try:
@@ -392,7 +473,7 @@ def batch_update(widget: 'QWidgetType'):
             except Exception:
                 pass
         else:
-            _update_hold_count[widget_id] = current_count
+            _update_hold_count[widget] = current_count
 
 
 # =============================================================================
@@ -400,11 +481,139 @@ def batch_update(widget: 'QWidgetType'):
 # =============================================================================
 
 
+# QSS templates compiled once at import; the cached helpers below fill
+# them in at most once per unique color combination
+_BUTTON_QSS_TEMPLATE = """
+    QPushButton {{
+        background-color: {fg};
+        color: {text};
+        border: none;
+        border-radius: 4px;
+    }}
+    QPushButton:hover {{
+        background-color: {hover};
+    }}
+"""
+
+_CARD_QSS_TEMPLATE = """
+    QFrame[paused="false"] {{
+        background-color: {active_bg};
+        border-radius: 8px;
+    }}
+    QFrame[paused="true"] {{
+        background-color: {paused_bg};
+        border-radius: 8px;
+    }}
+    QLabel {{
+        background: transparent;
+    }}
+    QLabel#cardName {{
+        color: {text};
+    }}
+    QLabel#cardDuration {{
+        color: {accent};
+    }}
+    QFrame[paused="true"] QLabel#cardDuration {{
+        color: {muted};
+    }}
+    QLabel#cardStarted {{
+        color: {muted};
+    }}
+"""
+
+
+def _as_str(value) -> str:
+    """str() only when needed; cell values are usually already strings."""
+    return value if type(value) is str else str(value)
+
+
+@functools.lru_cache(maxsize=256)
+def _button_qss(fg: str, hover: str, text: str) -> str:
+    """Shared QSS for an action button color combo.
+
+    Qt reparses a stylesheet string every time it is set, so identical
+    button styles across rows and tables reuse one pre-built string."""
+    return _BUTTON_QSS_TEMPLATE.format(fg=fg, hover=hover, text=text)
+
+
+@functools.lru_cache(maxsize=64)
+def _card_qss(active_bg: str, paused_bg: str, text: str, accent: str,
+              muted: str) -> str:
+    """Two-state QSS for a session card; the paused property picks the rules
+    for both the card background and the duration label color."""
+    return _CARD_QSS_TEMPLATE.format(active_bg=active_bg, paused_bg=paused_bg,
+                                     text=text, accent=accent, muted=muted)
+
+
+@functools.lru_cache(maxsize=32)
+def _stopped_card_qss(bg: str, text: str, muted: str) -> str:
+    """Shared QSS for a stopped session card and its labels."""
+    return f"""
+        QFrame {{
+            background-color: {bg};
+            border-radius: 8px;
+        }}
+        QLabel {{
+            background: transparent;
+        }}
+        QLabel#cardName {{
+            color: {text};
+        }}
+        QLabel#cardDuration {{
+            color: {muted};
+        }}
+        QLabel#cardStopped {{
+            color: {muted};
+        }}
+    """
+
+
+@functools.lru_cache(maxsize=16)
+def _dialog_btn_qss(bg: str, text: str, hover: str) -> str:
+    """Shared QSS for dialog OK/Yes/No buttons."""
+    return f"""
+        QPushButton {{
+            background-color: {bg};
+            color: {text};
+            border: none;
+            border-radius: 6px;
+        }}
+        QPushButton:hover {{
+            background-color: {hover};
+        }}
+    """
+
+
+@functools.lru_cache(maxsize=32)
+def _tab_button_qss(bg: str, text: str, hover: Optional[str] = None) -> str:
+    """Shared QSS for a tab button state (hover rule only when unselected)."""
+    qss = f"""
+        QPushButton {{
+            background-color: {bg};
+            color: {text};
+            border: none;
+            border-radius: 6px;
+            padding: 6px 16px;
+        }}
+    """
+    if hover is not None:
+        qss += f"""
+        QPushButton:hover {{
+            background-color: {hover};
+        }}
+    """
+    return qss
+
+
 class TableRow(QFrame):
     """
     A single row in the Table.
 
-    Each row contains cells (QLabel) and optional action buttons.
+    Cell text and column borders are painted directly in paintEvent
+    rather than held as child widgets, so a row costs one QObject plus
+    its action buttons (which stay real QPushButtons for hover/click
+    state). For a large table this removes the per-cell QLabel, the
+    per-row layout, and the style passes over both.
 
     Args:
         parent: Parent widget
@@ -416,8 +625,21 @@ class TableRow(QFrame):
         actions: List of action button configurations
         row_padding: Additional padding for the row
         is_header: If True, applies header styling (bold, different background)
+        colors: Theme color dict; passed in by Table so bulk row builds
+            share one lookup
+        draw_divider: If True, the row paints a 1px separator along its
+            top edge (cheaper than a divider widget per row)
     """
 
+    # Treeview-style anchors with AlignVCenter pre-combined, built once
+    # at class load instead of a dict per cell
+    _ANCHOR_MAP = {
+        'w': Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+        'e': Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+        'center': Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+        'c': Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignVCenter,
+    }
+
     def __init__(
         self,
         parent: QWidget,
@@ -432,22 +654,18 @@ class TableRow(QFrame):
         column_border_mode: str = "none",
         text_time_boundary: int = 0,
         border_after_first: bool = False,
-        border_before_last: bool = False
+        border_before_last: bool = False,
+        colors: Optional[dict] = None,
+        draw_divider: bool = False
     ):
         super().__init__(parent)
-        colors = get_colors()
-
-        # Header rows get different styling
-        if is_header:
-            bg_color = colors["bg_light"]
-        else:
-            bg_color = colors["bg_medium"]
+        self._draw_divider = draw_divider
 
-        # Store original background for selection toggle
-        self._bg_color = bg_color
+        # Background comes from the table-level stylesheet, selected by
+        # these dynamic properties (no per-row QSS parse)
         self._is_selected = False
-
-        self.setStyleSheet(f"background-color: {bg_color}; border: none;")
+        self.setProperty("header", is_header)
+        self.setProperty("selected", False)
         self.setFixedHeight(34)
 
         self.row_id = row_id
@@ -461,119 +679,173 @@ class TableRow(QFrame):
         self.text_time_boundary = text_time_boundary
         self.border_after_first = border_after_first
         self.border_before_last = border_before_last
-        self.cell_labels: list[QLabel] = []
+        self._colors = colors if colors is not None else get_colors()
         self.action_buttons: list[QPushButton] = []
+        self._action_slots: list[Callable] = []
+        self._actions_built = False  # Buttons are deferred to first show
+
+        # Painting state: geometry precomputed once, QColors/QFont shared
+        self._cell_font = get_font(13, QFont.Weight.Bold) if is_header else get_font(13)
+        self._text_qcolor = QColor(self._colors["text_primary"])
+        self._border_qcolor = QColor(self._colors["text_secondary"])
+        self._separator_qcolor = QColor(self._colors["separator"])
+        self._cell_rects: list[QRect] = []
+        self._cell_flags: list[int] = []
+        self._border_xs: list[int] = []
+        self._min_width = 0
 
         self._build_row(row_padding)
 
     def _build_row(self, padding: int):
-        """Build the row with cells and optional action buttons."""
-        colors = get_colors()
+        """Precompute cell geometry; cells are painted, not widgets.
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(4, 0, 4, 0)
-        layout.setSpacing(8)
+        Action buttons are created lazily in showEvent, so rows built
+        while their tab (or table) is hidden skip the cost entirely.
+        """
+        self._compute_cell_geometry()
+
+    def _should_border_before(self, i: int, num_columns: int) -> bool:
+        """Whether a vertical column border precedes cell i."""
+        if i == 0:  # Never before first cell
+            return False
+        if self.column_border_mode == "all":
+            return True
+        if self.column_border_mode == "text_time":
+            # Border after first column (before index 1)
+            if self.border_after_first and i == 1:
+                return True
+            # Border at text_time_boundary (after that column index)
+            if i == self.text_time_boundary + 1:
+                return True
+            # Border before last column
+            if self.border_before_last and i == num_columns - 1:
+                return True
+        return False
+
+    def _compute_cell_geometry(self):
+        """Rebuild cell rects, alignment flags, and border x positions.
+
+        Mirrors the metrics of the old QHBoxLayout: 4px side margins,
+        8px spacing, 1px borders, 34px row height.
+        """
+        self._cell_rects = []
+        self._cell_flags = []
+        self._border_xs = []
 
         num_columns = len(self.values)
-
-        # Create cells for each value
-        for i, (value, width, anchor) in enumerate(zip(self.values, self.column_widths, self.column_anchors)):
-            # Determine if we should add a border before this cell
-            should_add_border = False
-            if i > 0:  # Never before first cell
-                if self.column_border_mode == "all":
-                    should_add_border = True
-                elif self.column_border_mode == "text_time":
-                    # Border after first column (before index 1)
-                    if self.border_after_first and i == 1:
-                        should_add_border = True
-                    # Border at text_time_boundary (after that column index)
-                    elif i == self.text_time_boundary + 1:
-                        should_add_border = True
-                    # Border before last column
-                    elif self.border_before_last and i == num_columns - 1:
-                        should_add_border = True
-
-            if should_add_border:
-                border = ColumnBorder(self)
-                layout.addWidget(border)
-
-            # Map anchor to Qt alignment
-            alignment = self._map_anchor(anchor)
-
-            label = QLabel(str(value))
-            label.setFixedWidth(width)
-            label.setAlignment(alignment | Qt.AlignmentFlag.AlignVCenter)
-
-            font = QFont(FONT_FAMILY, 13)
-            if self.is_header:
-                font.setBold(True)
-            label.setFont(font)
-            label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
-
-            layout.addWidget(label)
-            self.cell_labels.append(label)
-
-        # Add spacer to push actions to the right
-        layout.addStretch()
-
-        # Create action buttons if provided
-        if self.actions and not self.is_header:
-            for action in self.actions:
-                btn = QPushButton(action.get("text", ""))
-                btn.setFixedSize(action.get("width", 60), 28)
-                btn.setFont(QFont(FONT_FAMILY, 11))
-
-                fg_color = action.get("fg_color", colors["bg_light"])
-                hover_color = action.get("hover_color", colors["separator"])
-                text_color = action.get("text_color", colors["text_primary"])
-
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {fg_color};
-                        color: {text_color};
-                        border: none;
-                        border-radius: 4px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {hover_color};
-                    }}
-                """)
-                btn.clicked.connect(lambda checked, a=action: self._handle_action(a["action_id"]))
-
-                layout.addWidget(btn)
-                self.action_buttons.append(btn)
-
-    def _map_anchor(self, anchor: str) -> Qt.AlignmentFlag:
-        """Map treeview-style anchors to Qt alignment."""
-        mapping = {
-            'w': Qt.AlignmentFlag.AlignLeft,
-            'e': Qt.AlignmentFlag.AlignRight,
-            'center': Qt.AlignmentFlag.AlignHCenter,
-            'c': Qt.AlignmentFlag.AlignHCenter,
-        }
-        return mapping.get(anchor, Qt.AlignmentFlag.AlignLeft)
-
-    def _handle_action(self, action_id: str):
-        """Handle action button click."""
+        x = 4
+        for i, (width, anchor) in enumerate(zip(self.column_widths, self.column_anchors)):
+            if self._should_border_before(i, num_columns):
+                self._border_xs.append(x)
+                x += 1 + 8
+            self._cell_rects.append(QRect(x, 0, width, 34))
+            self._cell_flags.append(
+                int(self._ANCHOR_MAP.get(anchor, self._ANCHOR_MAP['w'])))
+            x += width + 8
+        self._min_width = x - 8 + 4  # Drop trailing spacing, add right margin
+
+    def showEvent(self, event):
+        """Build deferred action buttons the first time the row appears."""
+        if not self._actions_built:
+            self._actions_built = True
+            if self.actions and not self.is_header:
+                self._build_action_buttons()
+        super().showEvent(event)
+
+    def _build_action_buttons(self):
+        """Create the action buttons (deferred from _build_row)."""
+        colors = self._colors
+
+        for action in self.actions:
+            btn = QPushButton(action.get("text", ""), self)
+            btn.setFixedSize(action.get("width", 60), 28)
+            btn.setFont(get_font(11))
+
+            fg_color = action.get("fg_color", colors["bg_light"])
+            hover_color = action.get("hover_color", colors["separator"])
+            text_color = action.get("text_color", colors["text_primary"])
+
+            btn.setStyleSheet(_button_qss(fg_color, hover_color, text_color))
+            slot = functools.partial(self._handle_action, action["action_id"])
+            btn.clicked.connect(slot)
+
+            # The parent is already visible, so children must be shown
+            # explicitly; there is no layout to do it
+            btn.show()
+            self.action_buttons.append(btn)
+            self._action_slots.append(slot)
+
+        self._layout_action_buttons()
+
+    def _layout_action_buttons(self):
+        """Right-align the buttons (4px margin, 8px spacing, centered)."""
+        x = self.width() - 4
+        for btn in reversed(self.action_buttons):
+            x -= btn.width()
+            btn.move(x, (self.height() - btn.height()) // 2)
+            x -= 8
+
+    def resizeEvent(self, event):
+        """Keep the buttons pinned to the right edge."""
+        super().resizeEvent(event)
+        if self.action_buttons:
+            self._layout_action_buttons()
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._min_width, 34)
+
+    def minimumSizeHint(self) -> QSize:
+        return QSize(self._min_width, 34)
+
+    def paintEvent(self, event):
+        """Paint the frame, then cell text, column borders, and divider."""
+        super().paintEvent(event)
+        painter = QPainter(self)
+
+        painter.setFont(self._cell_font)
+        painter.setPen(self._text_qcolor)
+        for rect, value, flags in zip(self._cell_rects, self.values, self._cell_flags):
+            painter.drawText(rect, flags, _as_str(value))
+
+        if self._border_xs:
+            painter.setPen(self._border_qcolor)
+            for x in self._border_xs:
+                painter.drawLine(x, 0, x, self.height() - 1)
+
+        if self._draw_divider:
+            painter.setPen(self._separator_qcolor)
+            painter.drawLine(0, 0, self.width() - 1, 0)
+
+    def _handle_action(self, action_id: str, *_):
+        """Handle action button click (extra args swallow clicked's checked)."""
         if self.on_action:
             self.on_action(self.row_id, action_id)
 
     def set_value(self, column_index: int, value: str):
         """Update the value of a specific cell."""
-        if 0 <= column_index < len(self.cell_labels):
-            self.cell_labels[column_index].setText(str(value))
+        if 0 <= column_index < len(self.values):
+            if self.values[column_index] == value:
+                return  # Ticking timers resend unchanged text constantly
             self.values[column_index] = value
+            # Repaint just this cell's rect
+            self.update(self._cell_rects[column_index])
 
     def set_column_width(self, column_index: int, width: int):
         """Update the width of a specific column's cell."""
-        if 0 <= column_index < len(self.cell_labels):
-            self.cell_labels[column_index].setFixedWidth(width)
+        if 0 <= column_index < len(self.values):
             self.column_widths[column_index] = width
+            self._compute_cell_geometry()
+            self.updateGeometry()
+            self.update()
 
     def update_actions(self, new_actions: list[dict]):
         """Update the action buttons for this row."""
-        colors = get_colors()
+        if not self._actions_built:
+            # Nothing on screen yet; first show builds from the new config
+            self.actions = new_actions
+            return
+
+        colors = self._colors
 
         # Update existing buttons or create new ones
         for i, action in enumerate(new_actions):
@@ -585,35 +857,28 @@ class TableRow(QFrame):
                 hover_color = action.get("hover_color", colors["separator"])
                 text_color = action.get("text_color", colors["text_primary"])
 
-                btn.setStyleSheet(f"""
-                    QPushButton {{
-                        background-color: {fg_color};
-                        color: {text_color};
-                        border: none;
-                        border-radius: 4px;
-                    }}
-                    QPushButton:hover {{
-                        background-color: {hover_color};
-                    }}
-                """)
-
-                # Disconnect old connections and connect new
-                try:
-                    btn.clicked.disconnect()
-                except Exception:
-                    pass
-                btn.clicked.connect(lambda checked, a=action: self._handle_action(a["action_id"]))
+                btn.setStyleSheet(_button_qss(fg_color, hover_color, text_color))
+
+                # Swap the known slot - no blanket disconnect with its
+                # swallowed exception on the first call
+                btn.clicked.disconnect(self._action_slots[i])
+                slot = functools.partial(self._handle_action, action["action_id"])
+                btn.clicked.connect(slot)
+                self._action_slots[i] = slot
 
         self.actions = new_actions
 
     def set_selected(self, is_selected: bool):
         """Set the visual selection state of this row."""
-        if self.is_header:
+        if self.is_header or is_selected == self._is_selected:
             return
         self._is_selected = is_selected
-        colors = get_colors()
-        new_bg = colors["row_selected"] if is_selected else self._bg_color
-        self.setStyleSheet(f"background-color: {new_bg}; border: none;")
+        # Flip the property and repolish; Qt re-evaluates the already
+        # parsed table stylesheet instead of parsing a new one
+        self.setProperty("selected", is_selected)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
 
 
 class ResizableHeaderRow(TableRow):
@@ -650,13 +915,17 @@ class ResizableHeaderRow(TableRow):
         column_border_mode: str = "none",
         text_time_boundary: int = 0,
         border_after_first: bool = False,
-        border_before_last: bool = False
+        border_before_last: bool = False,
+        colors: Optional[dict] = None
     ):
         self._table = table
         self._resize_column_index = -1  # Column being resized (-1 if none)
         self._resize_start_x = 0  # Mouse x position when drag started
         self._resize_start_width = 0  # Column width when drag started
         self._in_resize_zone = False  # Whether cursor is in resize zone
+        self._border_positions: list[int] = []  # Cached resize-handle x positions
+        self._positions_dirty = True  # Rebuild cache on next lookup
+        self._pending_width: Optional[tuple[int, int]] = None  # Latest (col, width) during drag
 
         super().__init__(
             parent,
@@ -669,27 +938,46 @@ class ResizableHeaderRow(TableRow):
             column_border_mode=column_border_mode,
             text_time_boundary=text_time_boundary,
             border_after_first=border_after_first,
-            border_before_last=border_before_last
+            border_before_last=border_before_last,
+            colors=colors
         )
 
         # Enable mouse tracking to detect hover over resize zones
         self.setMouseTracking(True)
 
+        # Coalesce drag updates to roughly display rate; applying a width
+        # touches every row, so doing it per mouse-move pixel is too costly
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self._flush_resize)
+
     def _get_column_border_positions(self) -> list[int]:
         """
         Calculate x positions of column borders (between columns).
 
         Returns a list of x positions where resize handles should appear.
         These are the right edges of columns (except the last column).
+        Cached between width changes so mouse-move hit testing doesn't
+        rebuild the list on every event.
         """
-        positions = []
-        x = 4  # left margin from setContentsMargins(4, 0, 4, 0)
+        if self._positions_dirty:
+            positions = []
+            x = 4  # left margin from setContentsMargins(4, 0, 4, 0)
+
+            for i in range(len(self.column_widths) - 1):  # Skip last column
+                x += self.column_widths[i] + 8  # width + spacing
+                positions.append(x - 4)  # center of the gap between columns
 
-        for i in range(len(self.column_widths) - 1):  # Skip last column
-            x += self.column_widths[i] + 8  # width + spacing
-            positions.append(x - 4)  # center of the gap between columns
+            self._border_positions = positions
+            self._positions_dirty = False
 
-        return positions
+        return self._border_positions
+
+    def set_column_width(self, column_index: int, width: int):
+        """Update the cell width and invalidate the border-position cache."""
+        super().set_column_width(column_index, width)
+        self._positions_dirty = True
 
     def _get_resize_column_at_pos(self, x: int) -> int:
         """
@@ -700,23 +988,27 @@ class ResizableHeaderRow(TableRow):
         """
         borders = self._get_column_border_positions()
 
-        for i, border_x in enumerate(borders):
-            if abs(x - border_x) <= self.RESIZE_ZONE_WIDTH:
+        # Positions are sorted, so only the neighbors of the insertion
+        # point can be within the resize zone
+        idx = bisect.bisect_left(borders, x)
+        for i in (idx - 1, idx):
+            if 0 <= i < len(borders) and abs(x - borders[i]) <= self.RESIZE_ZONE_WIDTH:
                 return i
 
         return -1
 
     def mouseMoveEvent(self, event):
         """Handle mouse move for cursor changes and resize dragging."""
-        from PyQt6.QtGui import QCursor
-
         x = event.position().x()
 
         if self._resize_column_index >= 0:
-            # Currently dragging - resize the column
+            # Currently dragging - remember the latest width and let the
+            # timer apply it at most once per interval
             delta = int(x - self._resize_start_x)
             new_width = max(self._resize_start_width + delta, self.MIN_COLUMN_WIDTH)
-            self._table.set_column_width(self._resize_column_index, new_width)
+            self._pending_width = (self._resize_column_index, new_width)
+            if not self._resize_timer.isActive():
+                self._resize_timer.start()
         else:
             # Check if we're in a resize zone
             col_index = self._get_resize_column_at_pos(int(x))
@@ -732,6 +1024,13 @@ class ResizableHeaderRow(TableRow):
 
         super().mouseMoveEvent(event)
 
+    def _flush_resize(self):
+        """Apply the most recent pending drag width to the table."""
+        if self._pending_width is not None:
+            col, width = self._pending_width
+            self._pending_width = None
+            self._table.set_column_width(col, width)
+
     def mousePressEvent(self, event):
         """Start resize operation if in resize zone."""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -749,6 +1048,9 @@ class ResizableHeaderRow(TableRow):
     def mouseReleaseEvent(self, event):
         """End resize operation."""
         if event.button() == Qt.MouseButton.LeftButton and self._resize_column_index >= 0:
+            # Apply whatever width is still pending before ending the drag
+            self._resize_timer.stop()
+            self._flush_resize()
             self._resize_column_index = -1
             return  # Don't propagate
 
@@ -756,7 +1058,8 @@ class ResizableHeaderRow(TableRow):
 
     def leaveEvent(self, event):
         """Reset cursor when leaving header area."""
-        if self._resize_column_index < 0:  # Only reset if not currently dragging
+        # Only touch the cursor if not dragging and it was actually changed
+        if self._resize_column_index < 0 and self._in_resize_zone:
             self.setCursor(Qt.CursorShape.ArrowCursor)
             self._in_resize_zone = False
 
@@ -764,24 +1067,19 @@ class ResizableHeaderRow(TableRow):
 
 
 class TableDivider(QFrame):
-    """A subtle divider line between table rows."""
+    """A subtle divider line between table rows (styled by the table sheet)."""
 
     def __init__(self, parent: QWidget):
         super().__init__(parent)
-        colors = get_colors()
         self.setFixedHeight(1)
-        self.setStyleSheet(f"background-color: {colors['separator']};")
 
 
 class ColumnBorder(QFrame):
-    """A vertical divider line between table columns."""
+    """A vertical divider line between table columns (styled by the table sheet)."""
 
     def __init__(self, parent: QWidget):
         super().__init__(parent)
-        colors = get_colors()
         self.setFixedWidth(1)
-        # Use text_secondary for high contrast against all backgrounds
-        self.setStyleSheet(f"background-color: {colors['text_secondary']};")
 
 
 class Table(QFrame):
@@ -842,7 +1140,7 @@ class Table(QFrame):
         border_before_last: bool = False
     ):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = colors = get_colors()
 
         self.setStyleSheet(f"""
             QFrame {{
@@ -865,14 +1163,15 @@ class Table(QFrame):
         self.border_before_last = border_before_last
 
         self.rows: dict[str, TableRow] = {}
-        self.row_order: list[str] = []
+        # Ordered-set idiom: dict keys keep insertion order with O(1) removal
+        self.row_order: dict[str, None] = {}
         self._header_row: Optional[TableRow] = None
 
         self._build_table()
 
     def _build_table(self):
         """Build the table structure."""
-        colors = get_colors()
+        colors = self._colors
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -899,9 +1198,20 @@ class Table(QFrame):
             {scrollbar_qss}
         """)
 
-        # Content widget inside scroll area
+        # Content widget inside scroll area. One stylesheet covers every
+        # row, divider, and column border beneath it: rows select their
+        # background via dynamic properties, so adding or selecting a row
+        # never parses QSS. (Rules live here rather than on the Table
+        # because the nearest ancestor sheet wins conflicts.)
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet(f"background-color: {colors['bg_medium']};")
+        self.content_widget.setStyleSheet(f"""
+            QWidget {{ background-color: {colors['bg_medium']}; }}
+            TableRow {{ background-color: {colors['bg_medium']}; border: none; }}
+            TableRow[header="true"] {{ background-color: {colors['bg_light']}; }}
+            TableRow[selected="true"] {{ background-color: {colors['row_selected']}; }}
+            TableDivider {{ background-color: {colors['separator']}; }}
+            ColumnBorder {{ background-color: {colors['text_secondary']}; }}
+        """)
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(0)
@@ -928,7 +1238,8 @@ class Table(QFrame):
             column_border_mode=self.column_border_mode,
             text_time_boundary=self.text_time_boundary,
             border_after_first=self.border_after_first,
-            border_before_last=self.border_before_last
+            border_before_last=self.border_before_last,
+            colors=self._colors
         )
         self.content_layout.addWidget(header_row)
         self._header_row = header_row
@@ -946,6 +1257,8 @@ class Table(QFrame):
             width: New width in pixels (will be clamped to minimum)
         """
         width = max(width, ResizableHeaderRow.MIN_COLUMN_WIDTH)
+        if self.widths[column_index] == width:
+            return  # Nothing to fan out to the rows
         self.widths[column_index] = width
 
         with batch_update(self.content_widget):
@@ -956,8 +1269,10 @@ class Table(QFrame):
 
     def update_header(self, column_index: int, text: str):
         """Update header text for a specific column."""
-        if self._header_row and 0 <= column_index < len(self._header_row.cell_labels):
-            self._header_row.cell_labels[column_index].setText(text)
+        if self._header_row and 0 <= column_index < len(self._header_row.values):
+            if self.columns[column_index] == text:
+                return
+            self._header_row.set_value(column_index, text)
             self.columns[column_index] = text
 
     def update_columns(self, columns: list[str], widths: list[int], anchors: Optional[list[str]] = None):
@@ -976,23 +1291,24 @@ class Table(QFrame):
         self.widths = widths
         self.anchors = anchors or ['w'] * len(columns)
 
-        # Clear existing data rows (but keep header)
-        self.clear_rows()
+        with batch_update(self.content_widget):
+            # Clear existing data rows (but keep header)
+            self.clear_rows()
 
-        # Rebuild header with new columns
-        if self._header_row:
-            self._header_row.deleteLater()
-            self._header_row = None
+            # Rebuild header with new columns
+            if self._header_row:
+                self._header_row.deleteLater()
+                self._header_row = None
 
-        # Remove header divider
-        if self.content_layout.count() > 0:
-            item = self.content_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+            # Remove header divider
+            if self.content_layout.count() > 0:
+                item = self.content_layout.takeAt(0)
+                if item and item.widget():
+                    item.widget().deleteLater()
 
-        # Re-add header
-        if self.show_header:
-            self._add_header()
+            # Re-add header
+            if self.show_header:
+                self._add_header()
 
     def add_divider(self):
         """Add an explicit separator divider line between rows (for group separators)."""
@@ -1019,10 +1335,33 @@ class Table(QFrame):
         Returns:
             The created TableRow
         """
-        # Add divider before row (except for first row)
-        if self.rows and self.show_dividers:
-            divider = TableDivider(self.content_widget)
-            self.content_layout.addWidget(divider)
+        return self._insert_row(row_id, values, actions, is_total)
+
+    def add_rows(self, rows: list[dict]) -> list["TableRow"]:
+        """
+        Add many rows in a single layout/paint pass.
+
+        Args:
+            rows: List of dicts with add_row's keyword arguments, e.g.
+                [{"row_id": "s1", "values": (...), "actions": [...]}]
+
+        Returns:
+            The created TableRows, in order
+        """
+        with batch_update(self.content_widget):
+            return [self._insert_row(**spec) for spec in rows]
+
+    def _insert_row(
+        self,
+        row_id: str,
+        values: tuple,
+        actions: Optional[list[dict]] = None,
+        is_total: bool = False
+    ) -> "TableRow":
+        """Shared insert logic behind add_row/add_rows."""
+        # Rows after the first paint their own top divider; the header
+        # keeps its explicit TableDivider widget
+        draw_divider = bool(self.rows) and self.show_dividers
 
         row = TableRow(
             self.content_widget,
@@ -1037,12 +1376,14 @@ class Table(QFrame):
             column_border_mode=self.column_border_mode,
             text_time_boundary=self.text_time_boundary,
             border_after_first=self.border_after_first,
-            border_before_last=self.border_before_last
+            border_before_last=self.border_before_last,
+            colors=self._colors,
+            draw_divider=draw_divider
         )
         self.content_layout.addWidget(row)
 
         self.rows[row_id] = row
-        self.row_order.append(row_id)
+        self.row_order[row_id] = None
 
         return row
 
@@ -1056,13 +1397,18 @@ class Table(QFrame):
             # Track items to keep (header + header divider)
             skip_count = 2 if self.show_header else 0
 
-            # Remove all items after header
-            while self.content_layout.count() > skip_count:
-                item = self.content_layout.takeAt(skip_count)
-                if item:
-                    widget = item.widget()
-                    if widget:
-                        widget.deleteLater()
+            # Take from the end so the layout never has to shift the
+            # remaining items forward on each removal
+            widgets = []
+            for i in range(self.content_layout.count() - 1, skip_count - 1, -1):
+                item = self.content_layout.takeAt(i)
+                widget = item.widget() if item else None
+                if widget is not None:
+                    widgets.append(widget)
+
+            for widget in widgets:
+                widget.setParent(None)
+                widget.deleteLater()
 
             self.rows.clear()
             self.row_order.clear()
@@ -1085,14 +1431,14 @@ class Table(QFrame):
 
     def get_children(self) -> list[str]:
         """Get all row IDs in order."""
-        return self.row_order.copy()
+        return list(self.row_order)
 
     def delete_row(self, row_id: str):
         """Remove a specific row."""
         row = self.rows.pop(row_id, None)
         if row:
             row.deleteLater()
-            self.row_order.remove(row_id)
+            self.row_order.pop(row_id, None)
 
 
 class SessionCard(QFrame):
@@ -1125,7 +1471,7 @@ class SessionCard(QFrame):
         on_toggle_pause: Optional[Callable[[str], None]] = None
     ):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = colors = get_colors()
 
         self.session_id = session_id
         self.project_name = project_name
@@ -1139,23 +1485,32 @@ class SessionCard(QFrame):
         self.play_green = colors["success"]
         self.play_green_hover = "#2ecc71"
 
-        self._update_card_style()
+        self.setProperty("paused", is_paused)
+        self._style_paused = is_paused  # Last state the style was polished for
+        self.setStyleSheet(
+            _card_qss(colors["session_active_bg"], colors["session_paused_bg"],
+                      colors["text_primary"], colors["success"],
+                      colors["text_secondary"]))
+        self._last_duration = duration
         self._build_card(started, duration)
 
     def _update_card_style(self):
         """Update card background based on pause state."""
-        colors = get_colors()
-        card_bg = colors["session_paused_bg"] if self.is_paused else colors["session_active_bg"]
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {card_bg};
-                border-radius: 8px;
-            }}
-        """)
+        if self.is_paused == self._style_paused:
+            return
+        self._style_paused = self.is_paused
+        self.setProperty("paused", self.is_paused)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+        # The duration label's color rule keys off the card's paused
+        # property, so it needs a repolish of its own
+        style.unpolish(self.duration_label)
+        style.polish(self.duration_label)
 
     def _build_card(self, started: str, duration: str):
         """Build the session card UI."""
-        colors = get_colors()
+        colors = self._colors
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 12, 15, 12)
@@ -1167,60 +1522,33 @@ class SessionCard(QFrame):
 
         # Project name (left)
         self.name_label = QLabel(self.project_name)
-        self.name_label.setFont(QFont(FONT_FAMILY, 14, QFont.Weight.Bold))
-        self.name_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        self.name_label.setObjectName("cardName")
+        self.name_label.setFont(get_font(14, QFont.Weight.Bold))
         top_row.addWidget(self.name_label)
 
         # Stop button
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setFixedSize(60, 26)
-        self.stop_btn.setFont(QFont(FONT_FAMILY, 11))
-        self.stop_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['danger']};
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['danger_hover']};
-            }}
-        """)
+        self.stop_btn.setFont(get_font(11))
+        self.stop_btn.setStyleSheet(
+            _button_qss(colors['danger'], colors['danger_hover'], "white"))
         self.stop_btn.clicked.connect(self._on_stop_click)
         top_row.addWidget(self.stop_btn)
 
         # Pause button
         self.pause_btn = QPushButton("Pause")
         self.pause_btn.setFixedSize(60, 26)
-        self.pause_btn.setFont(QFont(FONT_FAMILY, 11))
-        self.pause_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.pause_yellow};
-                color: #000000;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.pause_yellow_hover};
-            }}
-        """)
+        self.pause_btn.setFont(get_font(11))
+        self.pause_btn.setStyleSheet(
+            _button_qss(self.pause_yellow, self.pause_yellow_hover, "#000000"))
         self.pause_btn.clicked.connect(self._on_toggle_pause_click)
 
         # Play button
         self.play_btn = QPushButton("Play")
         self.play_btn.setFixedSize(60, 26)
-        self.play_btn.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
-        self.play_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {self.play_green};
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {self.play_green_hover};
-            }}
-        """)
+        self.play_btn.setFont(get_font(11, QFont.Weight.Bold))
+        self.play_btn.setStyleSheet(
+            _button_qss(self.play_green, self.play_green_hover, "#ffffff"))
         self.play_btn.clicked.connect(self._on_toggle_pause_click)
 
         # Show appropriate button based on pause state
@@ -1234,11 +1562,11 @@ class SessionCard(QFrame):
         # Spacer
         top_row.addStretch()
 
-        # Duration (right) - larger and prominent
-        duration_color = colors["success"] if not self.is_paused else colors["text_secondary"]
+        # Duration (right) - larger and prominent; color comes from the
+        # card stylesheet and follows the paused property
         self.duration_label = QLabel(duration)
-        self.duration_label.setFont(QFont(FONT_FAMILY, 16, QFont.Weight.Bold))
-        self.duration_label.setStyleSheet(f"color: {duration_color}; background: transparent;")
+        self.duration_label.setObjectName("cardDuration")
+        self.duration_label.setFont(get_font(16, QFont.Weight.Bold))
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         top_row.addWidget(self.duration_label)
 
@@ -1246,36 +1574,70 @@ class SessionCard(QFrame):
 
         # Bottom row: Started time
         self.started_label = QLabel(f"Started: {started}")
-        self.started_label.setFont(QFont(FONT_FAMILY, 11))
-        self.started_label.setStyleSheet(f"color: {colors['text_secondary']}; background: transparent;")
+        self.started_label.setObjectName("cardStarted")
+        self.started_label.setFont(get_font(11))
         layout.addWidget(self.started_label)
 
+    @pyqtSlot()
     def _on_stop_click(self):
         """Handle stop button click."""
         if self.on_stop:
             self.on_stop(self.session_id)
 
+    @pyqtSlot()
     def _on_toggle_pause_click(self):
         """Handle pause/resume button click."""
         if self.on_toggle_pause:
             self.on_toggle_pause(self.session_id)
 
+    def rebind(
+        self,
+        session_id: str,
+        project_name: str,
+        started: str,
+        duration: str,
+        is_paused: bool = False
+    ):
+        """Point a recycled card at a new session without rebuilding widgets.
+
+        Only label texts and the pause state change between sessions, so a
+        pooled card skips the whole layout/stylesheet construction path."""
+        self.session_id = session_id
+        self.project_name = project_name
+        self.is_paused = is_paused
+        self.name_label.setText(project_name)
+        self.started_label.setText(f"Started: {started}")
+        self.duration_label.setText(duration)
+        self._last_duration = duration
+        self._update_card_style()
+        # Apply button visibility unconditionally; the previous binding
+        # may have left either button showing
+        if is_paused:
+            self.pause_btn.hide()
+            self.play_btn.show()
+        else:
+            self.play_btn.hide()
+            self.pause_btn.show()
+
     def update_duration(self, duration: str):
-        """Update the displayed duration."""
+        """Update the displayed duration.
+
+        Ticks that don't change the rendered text (sub-second timers, a
+        paused session) skip the setText and its relayout/repaint."""
+        if duration == self._last_duration:
+            return
+        self._last_duration = duration
         self.duration_label.setText(duration)
 
     def update_pause_state(self, is_paused: bool):
         """Update the pause state and toggle Pause/Play button visibility."""
-        colors = get_colors()
+        if is_paused == self.is_paused:
+            return
         self.is_paused = is_paused
 
-        # Update card background
+        # Update card background and duration label color
         self._update_card_style()
 
-        # Update duration label color
-        duration_color = colors["success"] if not is_paused else colors["text_secondary"]
-        self.duration_label.setStyleSheet(f"color: {duration_color}; background: transparent;")
-
         # Toggle button visibility
         if is_paused:
             self.pause_btn.hide()
@@ -1308,24 +1670,21 @@ class StoppedSessionCard(QFrame):
         on_play: Optional[Callable[[str], None]] = None
     ):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = colors = get_colors()
 
         self.project_name = project_name
         self.on_play = on_play
 
-        # Card background
-        self.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['session_stopped_bg']};
-                border-radius: 8px;
-            }}
-        """)
+        # Card and label styling in one cached sheet
+        self.setStyleSheet(_stopped_card_qss(colors['session_stopped_bg'],
+                                             colors['text_primary'],
+                                             colors['text_secondary']))
 
         self._build_card(stop_date, duration)
 
     def _build_card(self, stop_date: str, duration: str):
         """Build the stopped session card UI."""
-        colors = get_colors()
+        colors = self._colors
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 12, 15, 12)
@@ -1337,26 +1696,17 @@ class StoppedSessionCard(QFrame):
 
         # Project name (left) - normal weight to differentiate from active
         self.name_label = QLabel(self.project_name)
-        self.name_label.setFont(QFont(FONT_FAMILY, 14))
-        self.name_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        self.name_label.setObjectName("cardName")
+        self.name_label.setFont(get_font(14))
         top_row.addWidget(self.name_label)
 
         # Play button (green)
         self.play_btn = QPushButton("Play")
         self.play_btn.setFixedSize(60, 26)
-        self.play_btn.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
+        self.play_btn.setFont(get_font(11, QFont.Weight.Bold))
         self.play_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.play_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['success']};
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: #2ecc71;
-            }}
-        """)
+        self.play_btn.setStyleSheet(
+            _button_qss(colors['success'], "#2ecc71", "#ffffff"))
         self.play_btn.clicked.connect(self._on_play_click)
         top_row.addWidget(self.play_btn)
 
@@ -1364,11 +1714,9 @@ class StoppedSessionCard(QFrame):
         top_row.addStretch()
 
         # Duration (right) - italics
-        duration_font = QFont(FONT_FAMILY, 14)
-        duration_font.setItalic(True)
         self.duration_label = QLabel(duration)
-        self.duration_label.setFont(duration_font)
-        self.duration_label.setStyleSheet(f"color: {colors['text_secondary']}; background: transparent;")
+        self.duration_label.setObjectName("cardDuration")
+        self.duration_label.setFont(get_font(14, italic=True))
         self.duration_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         top_row.addWidget(self.duration_label)
 
@@ -1376,10 +1724,11 @@ class StoppedSessionCard(QFrame):
 
         # Bottom row: Stopped date
         self.stopped_label = QLabel(f"Stopped: {stop_date}")
-        self.stopped_label.setFont(QFont(FONT_FAMILY, 11))
-        self.stopped_label.setStyleSheet(f"color: {colors['text_secondary']}; background: transparent;")
+        self.stopped_label.setObjectName("cardStopped")
+        self.stopped_label.setFont(get_font(11))
         layout.addWidget(self.stopped_label)
 
+    @pyqtSlot()
     def _on_play_click(self):
         """Handle play button click."""
         if self.on_play:
@@ -1410,9 +1759,11 @@ class SessionList(QFrame):
         max_stopped_cards: int = 3
     ):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = get_colors()
 
-        self.setStyleSheet("background: transparent;")
+        # No stylesheet: opting out of styled backgrounds keeps the frame
+        # transparent without giving the style engine a sheet to resolve
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
 
         self.on_stop = on_stop
         self.on_toggle_pause = on_toggle_pause
@@ -1421,13 +1772,14 @@ class SessionList(QFrame):
         self.max_stopped_cards = max_stopped_cards
 
         self.cards: dict[str, SessionCard] = {}
+        self._free_cards: list[SessionCard] = []  # Hidden cards kept for reuse
         self.stopped_list: Optional[StoppedSessionList] = None
 
         self._build_list()
 
     def _build_list(self):
         """Build the session list container."""
-        colors = get_colors()
+        colors = self._colors
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -1454,7 +1806,8 @@ class SessionList(QFrame):
 
         # Content widget
         self.content_widget = QWidget()
-        self.content_widget.setStyleSheet("background: transparent;")
+        self.content_widget.setAttribute(
+            Qt.WidgetAttribute.WA_StyledBackground, False)
         self.content_layout = QVBoxLayout(self.content_widget)
         self.content_layout.setContentsMargins(0, 0, 0, 0)
         self.content_layout.setSpacing(10)
@@ -1465,7 +1818,7 @@ class SessionList(QFrame):
 
         # Empty state label (shown when no active sessions)
         self.empty_label = QLabel(self.empty_message)
-        self.empty_label.setFont(QFont(FONT_FAMILY, 12))
+        self.empty_label.setFont(get_font(12))
         self.empty_label.setStyleSheet(f"color: {colors['text_secondary']}; background: transparent;")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.content_layout.addWidget(self.empty_label)
@@ -1477,8 +1830,13 @@ class SessionList(QFrame):
         self.active_layout.setSpacing(10)
         self.content_layout.addWidget(self.active_widget)
 
-        # Stopped sessions list (if enabled)
-        if self.on_play_stopped:
+        # The stopped-sessions list is created lazily by
+        # _ensure_stopped_list the first time a stopped card is added;
+        # most lists never show one
+
+    def _ensure_stopped_list(self) -> "StoppedSessionList":
+        """Create the stopped-sessions container on first use."""
+        if self.stopped_list is None:
             self.stopped_list = StoppedSessionList(
                 self.content_widget,
                 max_cards=self.max_stopped_cards,
@@ -1487,6 +1845,17 @@ class SessionList(QFrame):
             # Remove top margin as it's now inside another layout with spacing
             self.stopped_list.layout.setContentsMargins(0, 0, 0, 0)
             self.content_layout.addWidget(self.stopped_list)
+        return self.stopped_list
+
+    def add_stopped_session(
+        self,
+        project_name: str,
+        stop_date: str,
+        duration: str
+    ) -> StoppedSessionCard:
+        """Add a stopped session card, building the list on first call."""
+        return self._ensure_stopped_list().add_stopped_session(
+            project_name, stop_date, duration)
 
     def add_session(
         self,
@@ -1501,26 +1870,47 @@ class SessionList(QFrame):
         if not self.cards:
             self.empty_label.hide()
 
-        card = SessionCard(
-            self.active_widget,
-            session_id=session_id,
-            project_name=project_name,
-            started=started,
-            duration=duration,
-            is_paused=is_paused,
-            on_stop=self.on_stop,
-            on_toggle_pause=self.on_toggle_pause
-        )
+        if self._free_cards:
+            card = self._free_cards.pop()
+            card.rebind(session_id, project_name, started, duration, is_paused)
+        else:
+            card = SessionCard(
+                self.active_widget,
+                session_id=session_id,
+                project_name=project_name,
+                started=started,
+                duration=duration,
+                is_paused=is_paused,
+                on_stop=self.on_stop,
+                on_toggle_pause=self.on_toggle_pause
+            )
         self.active_layout.addWidget(card)
+        card.show()
 
         self.cards[session_id] = card
         return card
 
+    def add_sessions(self, sessions: list[dict]) -> list[SessionCard]:
+        """Add many session cards in one update pass.
+
+        Each dict holds the add_session keyword arguments. Suspending
+        updates around the loop coalesces the per-card relayouts and
+        repaints into a single pass, like Table.add_rows."""
+        with batch_update(self.active_widget):
+            return [self.add_session(**session) for session in sessions]
+
     def clear(self):
         """Remove all active session cards."""
         with batch_update(self.active_widget):
-            for card in self.cards.values():
-                card.deleteLater()
+            # Detach back-to-front so the layout never reindexes; cards go
+            # to the free pool instead of being destroyed, since the common
+            # refresh pattern is clear-then-readd of mostly the same set
+            for i in range(self.active_layout.count() - 1, -1, -1):
+                item = self.active_layout.takeAt(i)
+                widget = item.widget() if item else None
+                if widget is not None:
+                    widget.hide()
+                    self._free_cards.append(widget)
             self.cards.clear()
 
             # Show empty message
@@ -1568,11 +1958,12 @@ class StoppedSessionList(QFrame):
     ):
         super().__init__(parent)
 
-        self.setStyleSheet("background: transparent;")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, False)
 
         self.max_cards = max_cards
         self.on_play = on_play
         self.cards: list[StoppedSessionCard] = []  # Ordered list, oldest first
+        self._by_name: dict[str, StoppedSessionCard] = {}  # project_name -> card
 
         self._build_ui()
 
@@ -1596,6 +1987,7 @@ class StoppedSessionList(QFrame):
         # If at max, remove oldest (first in list)
         if len(self.cards) >= self.max_cards:
             oldest = self.cards.pop(0)
+            del self._by_name[oldest.project_name]
             self.layout.removeWidget(oldest)
             oldest.deleteLater()
 
@@ -1608,17 +2000,17 @@ class StoppedSessionList(QFrame):
             on_play=self.on_play
         )
         self.cards.append(card)
+        self._by_name[project_name] = card
         self.layout.addWidget(card)
         return card
 
     def remove_card(self, project_name: str):
         """Remove card for a specific project."""
-        for i, card in enumerate(self.cards):
-            if card.project_name == project_name:
-                self.cards.pop(i)
-                self.layout.removeWidget(card)
-                card.deleteLater()
-                break
+        card = self._by_name.pop(project_name, None)
+        if card is not None:
+            self.cards.remove(card)
+            self.layout.removeWidget(card)
+            card.deleteLater()
 
     def clear(self):
         """Remove all stopped cards."""
@@ -1626,6 +2018,7 @@ class StoppedSessionList(QFrame):
             self.layout.removeWidget(card)
             card.deleteLater()
         self.cards.clear()
+        self._by_name.clear()
 
     def has_cards(self) -> bool:
         """Return True if there are any stopped cards."""
@@ -1648,37 +2041,27 @@ class TabButton(QPushButton):
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.setCheckable(True)
-        self.setFont(QFont(FONT_FAMILY, 11))
+        self.setFont(get_font(11))
         self.setMinimumHeight(32)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._styled_state = None  # (selected, colors) last styled for
         self._update_style(False)
 
     def _update_style(self, selected: bool):
         """Update button style based on selection state."""
         colors = get_colors()
+        # Keying on the colors dict keeps the pre-guard behavior of
+        # picking up a theme switch on the next restyle request
+        if (selected, colors) == self._styled_state:
+            return
+        self._styled_state = (selected, colors)
         if selected:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {colors['bg_light']};
-                    color: {colors['text_primary']};
-                    border: none;
-                    border-radius: 6px;
-                    padding: 6px 16px;
-                }}
-            """)
+            self.setStyleSheet(
+                _tab_button_qss(colors['bg_light'], colors['text_primary']))
         else:
-            self.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {colors['container_bg']};
-                    color: {colors['text_primary']};
-                    border: none;
-                    border-radius: 6px;
-                    padding: 6px 16px;
-                }}
-                QPushButton:hover {{
-                    background-color: {colors['separator']};
-                }}
-            """)
+            self.setStyleSheet(
+                _tab_button_qss(colors['container_bg'], colors['text_primary'],
+                                colors['separator']))
 
     def setChecked(self, checked: bool):
         super().setChecked(checked)
@@ -1718,12 +2101,14 @@ class TabSwitcher(QFrame):
         layout.setSpacing(2)
 
         self.buttons: dict[str, TabButton] = {}
+        self._tab_names: dict[TabButton, str] = {}  # Reverse lookup for clicks
         self.button_group = QButtonGroup(self)
         self.button_group.setExclusive(True)
 
         for i, tab_name in enumerate(tabs):
             btn = TabButton(tab_name)
             self.buttons[tab_name] = btn
+            self._tab_names[btn] = tab_name
             self.button_group.addButton(btn, i)
             layout.addWidget(btn)
 
@@ -1737,12 +2122,14 @@ class TabSwitcher(QFrame):
         self._current_tab = tabs[0] if tabs else ""
         self._on_tab_change = None
 
+    @pyqtSlot(QAbstractButton)
     def _on_button_clicked(self, button):
-        """Handle tab button click."""
-        for name, btn in self.buttons.items():
-            btn._update_style(btn == button)
-            if btn == button:
-                self._current_tab = name
+        """Handle tab button click; only the two affected buttons restyle."""
+        previous = self.buttons.get(self._current_tab)
+        if previous is not None and previous is not button:
+            previous._update_style(False)
+        button._update_style(True)
+        self._current_tab = self._tab_names[button]
 
         if self._on_tab_change:
             self._on_tab_change(self._current_tab)
@@ -1757,11 +2144,14 @@ class TabSwitcher(QFrame):
 
     def set_current_tab(self, tab_name: str):
         """Set the current tab by name."""
-        if tab_name in self.buttons:
-            self.buttons[tab_name].setChecked(True)
-            self._current_tab = tab_name
-            for name, btn in self.buttons.items():
-                btn._update_style(name == tab_name)
+        button = self.buttons.get(tab_name)
+        if button is None:
+            return
+        previous = self.buttons.get(self._current_tab)
+        if previous is not None and previous is not button:
+            previous._update_style(False)
+        button.setChecked(True)  # setChecked restyles the button itself
+        self._current_tab = tab_name
 
 
 # =============================================================================
@@ -1773,7 +2163,7 @@ class MessageBox(QDialog):
 
     def __init__(self, parent: QWidget, title: str, message: str, msg_type: str = "info"):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = colors = get_colors()
 
         self.setWindowTitle(title)
         self.setFixedSize(350, 150)
@@ -1784,23 +2174,22 @@ class MessageBox(QDialog):
 
         # Center on parent
         if parent:
-            parent_geo = parent.geometry()
-            x = parent_geo.x() + (parent_geo.width() - 350) // 2
-            y = parent_geo.y() + (parent_geo.height() - 150) // 2
-            self.move(x, y)
+            geo = self.frameGeometry()
+            geo.moveCenter(parent.frameGeometry().center())
+            self.move(geo.topLeft())
 
         self.exec()
 
     def _build_ui(self, message: str):
         """Build the dialog UI."""
-        colors = get_colors()
+        colors = self._colors
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
 
         # Message label
         msg_label = QLabel(message)
-        msg_label.setFont(QFont(FONT_FAMILY, 11))
+        msg_label.setFont(get_font(11))
         msg_label.setStyleSheet(f"color: {colors['text_primary']};")
         msg_label.setWordWrap(True)
         msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1814,18 +2203,9 @@ class MessageBox(QDialog):
 
         ok_btn = QPushButton("OK")
         ok_btn.setFixedSize(100, 32)
-        ok_btn.setFont(QFont(FONT_FAMILY, 11))
-        ok_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['bg_light']};
-                color: {colors['text_primary']};
-                border: none;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['separator']};
-            }}
-        """)
+        ok_btn.setFont(get_font(11))
+        ok_btn.setStyleSheet(_dialog_btn_qss(
+            colors['bg_light'], colors['text_primary'], colors['separator']))
         ok_btn.clicked.connect(self.accept)
         btn_layout.addWidget(ok_btn)
 
@@ -1838,7 +2218,7 @@ class ConfirmDialog(QDialog):
 
     def __init__(self, parent: QWidget, title: str, message: str):
         super().__init__(parent)
-        colors = get_colors()
+        self._colors = colors = get_colors()
 
         self.result = False
 
@@ -1851,23 +2231,22 @@ class ConfirmDialog(QDialog):
 
         # Center on parent
         if parent:
-            parent_geo = parent.geometry()
-            x = parent_geo.x() + (parent_geo.width() - 350) // 2
-            y = parent_geo.y() + (parent_geo.height() - 150) // 2
-            self.move(x, y)
+            geo = self.frameGeometry()
+            geo.moveCenter(parent.frameGeometry().center())
+            self.move(geo.topLeft())
 
         self.exec()
 
     def _build_ui(self, message: str):
         """Build the dialog UI."""
-        colors = get_colors()
+        colors = self._colors
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
 
         # Message label
         msg_label = QLabel(message)
-        msg_label.setFont(QFont(FONT_FAMILY, 11))
+        msg_label.setFont(get_font(11))
         msg_label.setStyleSheet(f"color: {colors['text_primary']};")
         msg_label.setWordWrap(True)
         msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
@@ -1881,35 +2260,17 @@ class ConfirmDialog(QDialog):
 
         yes_btn = QPushButton("Yes")
         yes_btn.setFixedSize(80, 32)
-        yes_btn.setFont(QFont(FONT_FAMILY, 11))
-        yes_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['bg_light']};
-                color: {colors['text_primary']};
-                border: none;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['separator']};
-            }}
-        """)
+        yes_btn.setFont(get_font(11))
+        yes_btn.setStyleSheet(_dialog_btn_qss(
+            colors['bg_light'], colors['text_primary'], colors['separator']))
         yes_btn.clicked.connect(self._yes)
         btn_layout.addWidget(yes_btn)
 
         no_btn = QPushButton("No")
         no_btn.setFixedSize(80, 32)
-        no_btn.setFont(QFont(FONT_FAMILY, 11))
-        no_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['bg_light']};
-                color: {colors['text_primary']};
-                border: none;
-                border-radius: 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['separator']};
-            }}
-        """)
+        no_btn.setFont(get_font(11))
+        no_btn.setStyleSheet(_dialog_btn_qss(
+            colors['bg_light'], colors['text_primary'], colors['separator']))
         no_btn.clicked.connect(self._no)
         btn_layout.addWidget(no_btn)
 
@@ -1948,8 +2309,21 @@ def get_scrollbar_qss(
     """
     colors = get_colors()
     track_color = "transparent" if transparent_track else colors["scrollbar_track"]
-    thumb_color = colors["scrollbar_thumb"]
-    thumb_hover = colors["scrollbar_thumb_hover"]
+    return _scrollbar_qss(track_color, colors["scrollbar_thumb"],
+                          colors["scrollbar_thumb_hover"],
+                          vertical, horizontal, width)
+
+
+@functools.lru_cache(maxsize=32)
+def _scrollbar_qss(
+    track_color: str,
+    thumb_color: str,
+    thumb_hover: str,
+    vertical: bool,
+    horizontal: bool,
+    width: int
+) -> str:
+    """Build the scrollbar QSS once per color/orientation/width combo."""
     border_radius = max(3, width // 3)
 
     qss_parts = []
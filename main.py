@@ -3,21 +3,110 @@
 import sys
 
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QStackedWidget,
+    QApplication, QLabel, QMainWindow, QWidget, QStackedWidget,
     QHBoxLayout, QVBoxLayout, QStatusBar
 )
-from PyQt6.QtGui import QAction, QFont
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QAction, QFont, QIcon
+from PyQt6.QtCore import QObject, Qt, QThreadPool, QTimer, pyqtSignal
 
 from jframes import (
-    TabSwitcher, get_colors, set_theme, FONT_FAMILY,
-    register_theme_callback
+    TabSwitcher, MessageBox, get_colors, get_current_theme, set_theme,
+    FONT_FAMILY, register_theme_callback
 )
 from config import get_config, ConfigManager, APP_DIR
 from database import DatabaseManager
 from widgets import ProjectTaskWidget, SettingsWidget, CalendarWidget, HistoryWidget
 
 
+# Application-wide stylesheet template. All window-chrome styling lives
+# in this one sheet, applied through QApplication, so a theme change is a
+# single parse and polish pass instead of one per widget. Keeping it as a
+# module constant interns the template and leaves the per-theme cost at
+# one format_map call
+_GLOBAL_QSS_TMPL = """
+        QMainWindow {{
+            background-color: {bg_dark};
+        }}
+        QMenuBar {{
+            background-color: {bg_dark};
+            color: {text_primary};
+            border-bottom: 1px solid {separator};
+            padding: 2px;
+        }}
+        QMenuBar::item {{
+            background-color: transparent;
+            padding: 4px 12px;
+            border-radius: 4px;
+        }}
+        QMenuBar::item:selected {{
+            background-color: {bg_light};
+        }}
+        QMenu {{
+            background-color: {card_bg};
+            color: {text_primary};
+            border: 1px solid {separator};
+            border-radius: 6px;
+            padding: 4px;
+        }}
+        QMenu::item {{
+            padding: 6px 24px;
+            border-radius: 4px;
+        }}
+        QMenu::item:selected {{
+            background-color: {bg_light};
+        }}
+        QMenu::separator {{
+            height: 1px;
+            background-color: {separator};
+            margin: 4px 8px;
+        }}
+        QStatusBar {{
+            background-color: {bg_dark};
+            color: {text_secondary};
+            border-top: 1px solid {separator};
+            padding: 2px 8px;
+        }}
+        QWidget#centralWidget {{
+            background-color: {bg_dark};
+        }}
+        QStackedWidget, QWidget#tasksTab {{
+            background: transparent;
+        }}
+    """
+
+
+# One composed sheet per theme; toggling back to a theme reuses the
+# same string, which also lets Qt skip work when the sheet is unchanged
+_GLOBAL_QSS_CACHE: dict[str, str] = {}
+
+
+# Decoded once per process; windows share the instance. The icon stays a
+# plain file rather than a compiled Qt resource: PyQt6 ships no resource
+# compiler, and with no stylesheet image references the style engine
+# never touches the filesystem for it after this single load
+_app_icon = None
+
+
+def _get_app_icon() -> QIcon:
+    """Get the application icon, decoding the .ico file only once."""
+    global _app_icon
+    if _app_icon is None:
+        _app_icon = QIcon(str(APP_DIR / "setado_ico.ico"))
+    return _app_icon
+
+
+def _global_qss() -> str:
+    """Get the cached application-wide stylesheet for the current theme.
+
+    This is also the module's only get_colors call site: colors are
+    resolved at most once per theme, when its sheet is first composed."""
+    theme = get_current_theme().name
+    qss = _GLOBAL_QSS_CACHE.get(theme)
+    if qss is None:
+        qss = _GLOBAL_QSS_CACHE[theme] = _GLOBAL_QSS_TMPL.format_map(get_colors())
+    return qss
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
 
@@ -30,9 +119,32 @@ class MainWindow(QMainWindow):
         self.config = get_config()
         self.project_widgets: list[ProjectTaskWidget] = []
 
+        # Tabs are built on first visit; placeholders hold their stack
+        # slots until then (Tasks is materialized immediately at startup)
+        self.settings_widget = None
+        self.calendar_widget = None
+        self.history_widget = None
+        self._tab_factories = {
+            "Tasks": self._make_tasks_tab,
+            "Settings": self._make_settings_tab,
+            "Calendar": self._make_calendar_tab,
+            "History": self._make_history_tab,
+        }
+        self._tab_instances: dict[str, QWidget] = {}
+        self._refresh_pending = False  # Coalesces project_changed bursts
+        self._changed_projects: set[int] = set()  # Ids pending refresh
+        # Tabs whose data is stale; refreshed on next visit. Both data
+        # tabs start stale since they populate on first refresh
+        self._dirty_tabs = {"Calendar", "History"}
+        self._frame_pool: list[ProjectTaskWidget] = []  # Parked hidden frames
+
+        # Debounces config writes from rapid project selections
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self._do_save_frame_projects)
+
         self.setWindowTitle("Setado")
-        from PyQt6.QtGui import QIcon
-        self.setWindowIcon(QIcon(str(APP_DIR / "setado_ico.ico")))
         self._update_minimum_size()
 
         # Apply theme
@@ -46,23 +158,19 @@ class MainWindow(QMainWindow):
         register_theme_callback(self._on_theme_changed)
 
     def _apply_theme(self):
-        """Apply theme colors to the main window."""
-        colors = get_colors()
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {colors['bg_dark']};
-            }}
-        """)
+        """Apply the current theme's global stylesheet application-wide."""
+        QApplication.instance().setStyleSheet(_global_qss())
 
     def _on_theme_changed(self):
         """Handle theme change - restyle everything."""
         self._apply_theme()
-        self._style_menu()
-        self._style_status_bar()
-        # Rebuild tabs to pick up new colors
-        self._rebuild_tasks_tab()
-        self._rebuild_calendar_tab()
-        self._rebuild_history_tab()
+        # No widget construction here: every materialized tab falls back
+        # to its placeholder and rebuilds with the new colors on the next
+        # visit. Selections are flushed first so the rebuilt tasks tab
+        # can restore them from config
+        self._do_save_frame_projects()
+        for tab_name in ("Tasks", "Calendar", "History"):
+            self._drop_tab(tab_name)
 
     def _update_minimum_size(self):
         """Update minimum window size based on frame count."""
@@ -92,58 +200,21 @@ class MainWindow(QMainWindow):
         self._style_menu()
 
     def _style_menu(self):
-        """Apply theme styling to the menu bar."""
-        colors = get_colors()
-        menubar = self.menuBar()
-        menubar.setFont(QFont(FONT_FAMILY, 10))
-        menubar.setStyleSheet(f"""
-            QMenuBar {{
-                background-color: {colors['bg_dark']};
-                color: {colors['text_primary']};
-                border-bottom: 1px solid {colors['separator']};
-                padding: 2px;
-            }}
-            QMenuBar::item {{
-                background-color: transparent;
-                padding: 4px 12px;
-                border-radius: 4px;
-            }}
-            QMenuBar::item:selected {{
-                background-color: {colors['bg_light']};
-            }}
-            QMenu {{
-                background-color: {colors['card_bg']};
-                color: {colors['text_primary']};
-                border: 1px solid {colors['separator']};
-                border-radius: 6px;
-                padding: 4px;
-            }}
-            QMenu::item {{
-                padding: 6px 24px;
-                border-radius: 4px;
-            }}
-            QMenu::item:selected {{
-                background-color: {colors['bg_light']};
-            }}
-            QMenu::separator {{
-                height: 1px;
-                background-color: {colors['separator']};
-                margin: 4px 8px;
-            }}
-        """)
+        """Set the menu bar font; colors come from the global stylesheet."""
+        self.menuBar().setFont(QFont(FONT_FAMILY, 10))
 
     def _show_settings(self):
         """Switch to the Settings tab."""
         self.tab_switcher.set_current_tab("Settings")
-        self.stack.setCurrentIndex(1)
+        self._on_tab_changed("Settings")
 
     def _setup_central_widget(self):
         """Set up the central widget with TabSwitcher + QStackedWidget."""
-        colors = get_colors()
-
+        # The widget is installed on the window only after the whole tree
+        # is built, so the window does one layout/polish pass instead of
+        # recalculating as each child lands
         central = QWidget()
-        central.setStyleSheet(f"background-color: {colors['bg_dark']};")
-        self.setCentralWidget(central)
+        central.setObjectName("centralWidget")
 
         main_layout = QVBoxLayout(central)
         main_layout.setContentsMargins(8, 8, 8, 4)
@@ -154,41 +225,75 @@ class MainWindow(QMainWindow):
         self.tab_switcher.set_on_tab_change(self._on_tab_changed)
         main_layout.addWidget(self.tab_switcher)
 
-        # Stacked widget for tab content
+        # Stacked widget for tab content; transparent via the global sheet
         self.stack = QStackedWidget()
-        self.stack.setStyleSheet("background: transparent;")
         main_layout.addWidget(self.stack, 1)
 
-        # Tasks tab (index 0)
+        # Every tab starts as an empty placeholder; _ensure_tab swaps in
+        # the real widget on first visit. Tasks is the startup view, so it
+        # is materialized right away
+        for _ in self.TAB_NAMES:
+            self.stack.addWidget(QWidget())
+        self._ensure_tab("Tasks")
+
+        self.setCentralWidget(central)
+
+    def _make_tasks_tab(self) -> QWidget:
+        """Build the tasks tab, keeping the tasks_tab attribute current."""
         self.tasks_tab = self._create_tasks_tab()
-        self.stack.addWidget(self.tasks_tab)
+        return self.tasks_tab
 
-        # Settings tab (index 1)
+    def _make_settings_tab(self) -> QWidget:
+        """Build the settings tab on first visit."""
         self.settings_widget = SettingsWidget()
         self.settings_widget.settings_changed.connect(self._on_settings_changed)
-        self.stack.addWidget(self.settings_widget)
+        return self.settings_widget
 
-        # Calendar tab (index 2)
+    def _make_calendar_tab(self) -> QWidget:
+        """Build the calendar tab on first visit."""
         self.calendar_widget = CalendarWidget(self.db)
-        self.stack.addWidget(self.calendar_widget)
+        return self.calendar_widget
 
-        # History tab (index 3)
+    def _make_history_tab(self) -> QWidget:
+        """Build the history tab on first visit."""
         self.history_widget = HistoryWidget(self.db)
-        self.stack.addWidget(self.history_widget)
+        return self.history_widget
+
+    def _ensure_tab(self, tab_name: str):
+        """Replace a tab's placeholder with the real widget on first visit."""
+        if tab_name not in self._tab_factories or tab_name in self._tab_instances:
+            return
+        widget = self._tab_factories[tab_name]()
+        self._tab_instances[tab_name] = widget
+        index = self.TAB_NAMES.index(tab_name)
+        placeholder = self.stack.widget(index)
+        self.stack.removeWidget(placeholder)
+        placeholder.deleteLater()
+        self.stack.insertWidget(index, widget)
 
     def _on_tab_changed(self, tab_name: str):
         """Handle tab switcher selection."""
         index = self.TAB_NAMES.index(tab_name)
+        # Task edits happen on the Tasks tab without a change signal of
+        # their own, so leaving it conservatively marks the data views
+        # stale; Calendar/History ping-pong still skips the re-query
+        if self.stack.currentIndex() == 0 and index != 0:
+            self._dirty_tabs.update(("Calendar", "History"))
+        self._ensure_tab(tab_name)
         self.stack.setCurrentIndex(index)
-        if tab_name == "Calendar":
-            self.calendar_widget.refresh()
-        elif tab_name == "History":
-            self.history_widget.refresh()
+        # Ping-ponging between tabs shouldn't re-query; only refresh
+        # views whose data went stale since they were last shown
+        if tab_name in self._dirty_tabs:
+            if tab_name == "Calendar":
+                self.calendar_widget.refresh()
+            elif tab_name == "History":
+                self.history_widget.refresh()
+            self._dirty_tabs.discard(tab_name)
 
     def _create_tasks_tab(self) -> QWidget:
         """Create the tasks tab with the configured number of frames."""
         tasks_tab = QWidget()
-        tasks_tab.setStyleSheet("background: transparent;")
+        tasks_tab.setObjectName("tasksTab")
         tasks_layout = QHBoxLayout(tasks_tab)
         tasks_layout.setContentsMargins(0, 0, 0, 0)
         tasks_layout.setSpacing(8)
@@ -199,7 +304,10 @@ class MainWindow(QMainWindow):
         # Create ProjectTaskWidget columns based on config
         for _ in range(self.config.frame_count):
             widget = ProjectTaskWidget(self.db)
-            widget.project_changed.connect(self._on_project_changed)
+            # Queued so the emitting widget isn't blocked on the refresh
+            # fan-out; also lets a burst coalesce before the flush runs
+            widget.project_changed.connect(
+                self._on_project_changed, Qt.ConnectionType.QueuedConnection)
             widget.project_selected.connect(self._save_frame_projects)
             self.project_widgets.append(widget)
             tasks_layout.addWidget(widget)
@@ -212,63 +320,88 @@ class MainWindow(QMainWindow):
 
         return tasks_tab
 
-    def _rebuild_tasks_tab(self):
-        """Rebuild the tasks tab with the new frame count."""
-        # Remember current tab
-        current_index = self.stack.currentIndex()
+    def _resize_tasks_tab(self):
+        """Adjust the number of task frames to the configured count.
 
-        # Remove old tasks tab
-        old_tab = self.stack.widget(0)
-        self.stack.removeWidget(old_tab)
-        old_tab.deleteLater()
+        Frame-count changes reuse the existing frames: shrinking parks
+        the extras hidden in a pool, growing draws from the pool before
+        constructing new frames, so a +/-1 change costs at most one
+        widget instead of a full tab rebuild."""
+        if "Tasks" not in self._tab_instances:
+            # Tab is parked; the next visit rebuilds with the new count
+            self._update_window_for_frame_count()
+            return
 
-        # Create new tasks tab
-        self.tasks_tab = self._create_tasks_tab()
-        self.stack.insertWidget(0, self.tasks_tab)
+        layout = self.tasks_tab.layout()
+        target = self.config.frame_count
 
-        # Update window size
-        self._update_minimum_size()
+        while len(self.project_widgets) > target:
+            widget = self.project_widgets.pop()
+            layout.removeWidget(widget)
+            widget.hide()
+            self._frame_pool.append(widget)
+
+        saved = self.config.frame_projects
+        while len(self.project_widgets) < target:
+            if self._frame_pool:
+                widget = self._frame_pool.pop()
+            else:
+                widget = ProjectTaskWidget(self.db)
+                widget.project_changed.connect(
+                    self._on_project_changed,
+                    Qt.ConnectionType.QueuedConnection)
+                widget.project_selected.connect(self._save_frame_projects)
+            slot = len(self.project_widgets)
+            self.project_widgets.append(widget)
+            layout.addWidget(widget)
+            widget.show()
+            # Restore the saved selection for the newly exposed slot
+            if slot < len(saved) and saved[slot] is not None:
+                widget.set_project_by_id(saved[slot])
 
-        # Resize window if it's smaller than the new minimum
+        self._update_window_for_frame_count()
+
+    def _update_window_for_frame_count(self):
+        """Refresh the minimum size and grow the window if now too small."""
+        self._update_minimum_size()
         current_size = self.size()
         min_width = self.FRAME_WIDTH * self.config.frame_count
         if current_size.width() < min_width:
             self.resize(min_width, current_size.height())
 
-        # Restore tab selection
-        self.stack.setCurrentIndex(current_index)
-
-    def _rebuild_calendar_tab(self):
-        """Rebuild the calendar tab with new theme colors."""
-        current_index = self.stack.currentIndex()
-
-        old_widget = self.stack.widget(2)
-        self.stack.removeWidget(old_widget)
-        old_widget.deleteLater()
-
-        self.calendar_widget = CalendarWidget(self.db)
-        self.stack.insertWidget(2, self.calendar_widget)
-
-        self.stack.setCurrentIndex(current_index)
-
-    def _rebuild_history_tab(self):
-        """Rebuild the history tab with new theme colors."""
+    def _drop_tab(self, tab_name: str):
+        """Discard a lazily built tab, restoring its placeholder.
+
+        The tab is rebuilt by _ensure_tab on the next visit; if it is
+        currently showing, rebuild immediately so the user never sees the
+        placeholder."""
+        widget = self._tab_instances.pop(tab_name, None)
+        if widget is None:
+            return
+        if tab_name == "Tasks":
+            # The frames die with the tab; forget them and the pool
+            self.project_widgets.clear()
+            self._frame_pool.clear()
+        else:
+            # A rebuilt data tab starts empty and must refresh on visit
+            self._dirty_tabs.add(tab_name)
+        index = self.TAB_NAMES.index(tab_name)
         current_index = self.stack.currentIndex()
-
-        old_widget = self.stack.widget(3)
-        self.stack.removeWidget(old_widget)
-        old_widget.deleteLater()
-
-        self.history_widget = HistoryWidget(self.db)
-        self.stack.insertWidget(3, self.history_widget)
-
+        self.stack.removeWidget(widget)
+        widget.deleteLater()
+        self.stack.insertWidget(index, QWidget())
+        if current_index == index:
+            self._ensure_tab(tab_name)
         self.stack.setCurrentIndex(current_index)
 
     def _on_settings_changed(self, changes: dict):
         """Handle settings changes."""
         if 'frame_count' in changes:
             self.config = get_config()
-            self._rebuild_tasks_tab()
+            # If a theme change in the same submit already parked the
+            # tasks tab, this only updates the window size; the next
+            # visit rebuilds once with both the new count and colors
+            self._resize_tasks_tab()
             self._save_frame_projects()
             self.status_bar.showMessage(
                 f"Task layout updated to {self.config.frame_count} frames", 3000
@@ -286,49 +419,101 @@ class MainWindow(QMainWindow):
         self.status_bar.showMessage("Ready")
 
     def _style_status_bar(self):
-        """Apply theme styling to the status bar."""
-        colors = get_colors()
+        """Set the status bar font; colors come from the global stylesheet."""
         self.status_bar.setFont(QFont(FONT_FAMILY, 9))
-        self.status_bar.setStyleSheet(f"""
-            QStatusBar {{
-                background-color: {colors['bg_dark']};
-                color: {colors['text_secondary']};
-                border-top: 1px solid {colors['separator']};
-                padding: 2px 8px;
-            }}
-        """)
 
     def _save_frame_projects(self):
-        """Save current project selections to config."""
+        """Schedule a debounced save of the current project selections."""
+        self._save_timer.start()
+
+    def _do_save_frame_projects(self):
+        """Write the current project selections to config."""
+        if "Tasks" not in self._tab_instances:
+            # Tab is parked; config already holds the last flushed state
+            return
         frame_projects = [w.current_project_id for w in self.project_widgets]
         ConfigManager().update(frame_projects=frame_projects)
 
-    def _on_project_changed(self):
-        """Handle project changes from any widget."""
+    def _on_project_changed(self, project_id: int):
+        """Handle project changes from any widget.
+
+        Bulk edits fire this once per widget in the same event-loop turn;
+        a zero-delay single shot coalesces them into one refresh pass."""
+        self._changed_projects.add(project_id)
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self._flush_project_refresh)
+
+    def _flush_project_refresh(self):
+        """Run the refresh fan-out once for a burst of change signals.
+
+        When the burst touched a single project, frames showing other
+        projects only reload their dropdowns and skip the task rebuild."""
+        self._refresh_pending = False
+        changed = self._changed_projects
+        self._changed_projects = set()
+        changed_id = changed.pop() if len(changed) == 1 else -1
         for widget in self.project_widgets:
-            widget.refresh_from_external()
+            widget.refresh_from_external(changed_id)
+        self._dirty_tabs.update(("Calendar", "History"))
         self._save_frame_projects()
         self.status_bar.showMessage("Projects updated", 3000)
 
     def closeEvent(self, event):
         """Handle window close."""
-        self._save_frame_projects()
+        self._save_timer.stop()
+        self._do_save_frame_projects()
         self.db.close()
         event.accept()
 
 
+class _DbLoader(QObject):
+    """Opens the database on a pool thread and hands it back via signal.
+
+    The signal is emitted from the worker thread, so delivery to the
+    GUI-thread receiver is automatically queued. A failed open (bad
+    path, corrupt file, permissions) emits the exception instead of a
+    handle - an exception that died on the pool thread would leave the
+    app stuck on the splash forever."""
+
+    ready = pyqtSignal(object)
+
+    def __init__(self, config):
+        super().__init__()
+        self._config = config
+
+    def run(self):
+        try:
+            result = DatabaseManager(self._config)
+        except Exception as exc:
+            result = exc
+        self.ready.emit(result)
+
+
+def _make_splash() -> QLabel:
+    """Build the minimal window shown while the database opens."""
+    colors = get_colors()
+    splash = QLabel("Setado\n\nLoading…")
+    splash.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    splash.setFont(QFont(FONT_FAMILY, 12))
+    splash.setFixedSize(280, 120)
+    splash.setStyleSheet(
+        f"background-color: {colors['bg_dark']}; color: {colors['text_primary']};")
+    return splash
+
+
 def main():
     """Application entry point."""
     # Initialize configuration
     ConfigManager()
     config = get_config()
 
-    # Initialize database
-    db = DatabaseManager(config)
-
     # Create and run application
     app = QApplication(sys.argv)
     app.setApplicationName("Setado")
+    # Application-wide icon; windows and dialogs inherit it
+    app.setWindowIcon(_get_app_icon())
 
     # Set application-wide Inter font
     app_font = QFont(FONT_FAMILY, 10)
@@ -340,8 +525,33 @@ def main():
     except ValueError:
         set_theme("dark")
 
-    window = MainWindow(db)
-    window.show()
+    # Open the database off the GUI thread so first paint isn't blocked
+    # on DB open + schema checks; the splash paints immediately and the
+    # main window replaces it when the handle arrives
+    splash = _make_splash()
+    splash.show()
+
+    window_ref: list[MainWindow] = []
+
+    def _on_db_ready(result):
+        if isinstance(result, Exception):
+            # Surface the failure and quit; the settings dialog points
+            # users here when they change database_path and restart
+            MessageBox(
+                splash, "Database Error",
+                f"Could not open the database:\n{result}\n\n"
+                "Check the database path in your configuration."
+            )
+            app.exit(1)
+            return
+        window = MainWindow(result)
+        window_ref.append(window)  # Keep a reference past this closure
+        window.show()
+        splash.close()
+
+    loader = _DbLoader(config)
+    loader.ready.connect(_on_db_ready)
+    QThreadPool.globalInstance().start(loader.run)
 
     sys.exit(app.exec())
 
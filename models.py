@@ -1,26 +1,38 @@
 """Data models for TodoUI."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Project data model."""
     id: Optional[int]
     name: str
     description: Optional[str] = None
     is_archived: bool = False
-    created_at: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.now)
     archived_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    @classmethod
+    def from_row(cls, row) -> "Project":
+        """Build a Project from a database row (positional, hot-path friendly).
 
+        Timestamp columns arrive already parsed (datetime or None) via the
+        sqlite3 converter registered in database.py.
+        """
+        return cls(
+            row["id"],
+            row["name"],
+            row["description"],
+            bool(row["is_archived"]),
+            row["created_at"],
+            row["archived_at"]
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """Task data model."""
     id: Optional[int]
@@ -30,10 +42,26 @@ class Task:
     due_date: Optional[datetime] = None
     is_completed: bool = False
     is_deleted: bool = False
-    created_at: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.now)
     completed_at: Optional[datetime] = None
     deleted_at: Optional[datetime] = None
 
-    def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
+    @classmethod
+    def from_row(cls, row) -> "Task":
+        """Build a Task from a database row (positional, hot-path friendly).
+
+        Timestamp columns arrive already parsed (datetime or None) via the
+        sqlite3 converter registered in database.py.
+        """
+        return cls(
+            row["id"],
+            row["project_id"],
+            row["title"],
+            row["priority"],
+            row["due_date"],
+            bool(row["is_completed"]),
+            bool(row["is_deleted"]),
+            row["created_at"],
+            row["completed_at"],
+            row["deleted_at"]
+        )
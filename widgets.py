@@ -1,8 +1,10 @@
 """Custom PyQt6 widgets for TodoUI - themed with jframes."""
 
+import functools
 import os
 import tempfile
 from datetime import datetime
+from string import Template
 from typing import Optional
 
 from PyQt6.QtWidgets import (
@@ -10,238 +12,449 @@ from PyQt6.QtWidgets import (
     QLineEdit, QSpinBox, QDateEdit, QLabel, QDialog,
     QTextEdit, QCheckBox, QFrame, QFileDialog, QScrollArea
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QDate, QTimer
+from PyQt6.QtCore import Qt, QObject, pyqtSignal, QDate, QThreadPool, QTimer
 from PyQt6.QtGui import QFont
 
 from jframes import (
     get_colors, get_dropdown_arrow_path, get_scrollbar_qss,
     batch_update, MessageBox, ConfirmDialog, FONT_FAMILY,
-    set_theme, get_available_themes, get_current_theme
+    set_theme, get_available_themes, get_current_theme, get_font
 )
 from database import DatabaseManager
 from models import Task
 from config import get_config, ConfigManager
 
 
-def _input_qss(colors: dict) -> str:
-    """Common QSS for input fields (QLineEdit, QSpinBox, QDateEdit)."""
-    return f"""
-        background-color: {colors['bg_medium']};
-        color: {colors['text_primary']};
-        border: 1px solid {colors['separator']};
+def _theme_cached(fn):
+    """Memoize a QSS helper on the current theme's name.
+
+    The helpers below are deterministic given a theme's colors dict, but
+    they run for every widget constructed - a task-list refresh calls
+    them once per row. Caching per theme name turns repeated calls into
+    a dict lookup; keys stay valid because a theme's colors never change
+    after registration.
+    """
+    cache: dict = {}
+
+    @functools.wraps(fn)
+    def wrapper(colors: dict):
+        key = get_current_theme().name
+        qss = cache.get(key)
+        if qss is None:
+            qss = cache[key] = fn(colors)
+        return qss
+
+    return wrapper
+
+
+# QSS bodies as precompiled templates: the $-substitution reuses the
+# parsed template, so even the once-per-theme cache misses skip the
+# f-string formatting work
+_INPUT_TMPL = Template("""
+        background-color: $bg_medium;
+        color: $text_primary;
+        border: 1px solid $separator;
         border-radius: 6px;
         padding: 4px 8px;
-        font-family: {FONT_FAMILY};
+        font-family: $font;
         font-size: 12px;
-    """
-
+    """)
 
-def _combo_qss(colors: dict) -> str:
-    """Common QSS for QComboBox with themed dropdown arrow."""
-    arrow_path = get_dropdown_arrow_path(colors['text_primary'])
-    return f"""
-        QComboBox {{
-            background-color: {colors['bg_medium']};
-            color: {colors['text_primary']};
-            border: 1px solid {colors['separator']};
+_COMBO_TMPL = Template("""
+        QComboBox {
+            background-color: $bg_medium;
+            color: $text_primary;
+            border: 1px solid $separator;
             border-radius: 6px;
             padding: 4px 28px 4px 8px;
-            font-family: {FONT_FAMILY};
+            font-family: $font;
             font-size: 12px;
-        }}
-        QComboBox:hover {{
-            border-color: {colors['text_secondary']};
-        }}
-        QComboBox::drop-down {{
+        }
+        QComboBox:hover {
+            border-color: $text_secondary;
+        }
+        QComboBox::drop-down {
             border: none;
             width: 24px;
-        }}
-        QComboBox::down-arrow {{
-            image: url({arrow_path});
+        }
+        QComboBox::down-arrow {
+            image: url($arrow_path);
             width: 10px;
             height: 7px;
-        }}
-        QComboBox QAbstractItemView {{
-            background-color: {colors['card_bg']};
-            color: {colors['text_primary']};
-            border: 1px solid {colors['separator']};
+        }
+        QComboBox QAbstractItemView {
+            background-color: $card_bg;
+            color: $text_primary;
+            border: 1px solid $separator;
             border-radius: 6px;
-            selection-background-color: {colors['bg_light']};
-            selection-color: {colors['text_primary']};
+            selection-background-color: $bg_light;
+            selection-color: $text_primary;
             outline: 0;
             padding: 4px;
-        }}
-    """
+        }
+    """)
 
-
-def _btn_success(colors: dict) -> str:
-    """QSS for success/primary action buttons."""
-    return f"""
-        QPushButton {{
-            background-color: {colors['success']};
+_BTN_SUCCESS_TMPL = Template("""
+        QPushButton {
+            background-color: $success;
             color: #ffffff;
             border: none;
             border-radius: 6px;
             padding: 6px 14px;
-            font-family: {FONT_FAMILY};
+            font-family: $font;
             font-size: 12px;
             font-weight: bold;
-        }}
-        QPushButton:hover {{
+        }
+        QPushButton:hover {
             background-color: #2ecc71;
-        }}
-    """
+        }
+    """)
 
-
-def _btn_danger(colors: dict) -> str:
-    """QSS for danger/destructive action buttons."""
-    return f"""
-        QPushButton {{
-            background-color: {colors['danger']};
+_BTN_DANGER_TMPL = Template("""
+        QPushButton {
+            background-color: $danger;
             color: #ffffff;
             border: none;
             border-radius: 6px;
             padding: 6px 14px;
-            font-family: {FONT_FAMILY};
+            font-family: $font;
             font-size: 12px;
-        }}
-        QPushButton:hover {{
-            background-color: {colors['danger_hover']};
-        }}
-    """
-
-
-def _btn_neutral(colors: dict) -> str:
-    """QSS for neutral/secondary buttons."""
-    return f"""
-        QPushButton {{
-            background-color: {colors['bg_light']};
-            color: {colors['text_primary']};
+        }
+        QPushButton:hover {
+            background-color: $danger_hover;
+        }
+    """)
+
+_BTN_NEUTRAL_TMPL = Template("""
+        QPushButton {
+            background-color: $bg_light;
+            color: $text_primary;
             border: none;
             border-radius: 6px;
             padding: 6px 14px;
-            font-family: {FONT_FAMILY};
+            font-family: $font;
             font-size: 12px;
-        }}
-        QPushButton:hover {{
-            background-color: {colors['separator']};
-        }}
-    """
-
-
-def _checkbox_qss(colors: dict) -> str:
-    """QSS for themed checkboxes."""
-    return f"""
-        QCheckBox {{
-            color: {colors['text_primary']};
+        }
+        QPushButton:hover {
+            background-color: $separator;
+        }
+    """)
+
+_CHECKBOX_TMPL = Template("""
+        QCheckBox {
+            color: $text_primary;
             spacing: 6px;
-            font-family: {FONT_FAMILY};
+            font-family: $font;
             font-size: 12px;
-        }}
-        QCheckBox::indicator {{
+        }
+        QCheckBox::indicator {
             width: 16px;
             height: 16px;
-            border: 2px solid {colors['separator']};
+            border: 2px solid $separator;
             border-radius: 4px;
-            background-color: {colors['bg_medium']};
-        }}
-        QCheckBox::indicator:hover {{
-            border-color: {colors['text_secondary']};
-        }}
-        QCheckBox::indicator:checked {{
-            background-color: {colors['success']};
-            border-color: {colors['success']};
-        }}
-    """
+            background-color: $bg_medium;
+        }
+        QCheckBox::indicator:hover {
+            border-color: $text_secondary;
+        }
+        QCheckBox::indicator:checked {
+            background-color: $success;
+            border-color: $success;
+        }
+    """)
+
+
+@_theme_cached
+def _input_qss(colors: dict) -> str:
+    """Common QSS for input fields (QLineEdit, QSpinBox, QDateEdit)."""
+    return _INPUT_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+@_theme_cached
+def _combo_qss(colors: dict) -> str:
+    """Common QSS for QComboBox with themed dropdown arrow."""
+    arrow_path = get_dropdown_arrow_path(colors['text_primary'])
+    return _COMBO_TMPL.substitute(colors, font=FONT_FAMILY, arrow_path=arrow_path)
+
+
+@_theme_cached
+def _btn_success(colors: dict) -> str:
+    """QSS for success/primary action buttons."""
+    return _BTN_SUCCESS_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+@_theme_cached
+def _btn_danger(colors: dict) -> str:
+    """QSS for danger/destructive action buttons."""
+    return _BTN_DANGER_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+@_theme_cached
+def _btn_neutral(colors: dict) -> str:
+    """QSS for neutral/secondary buttons."""
+    return _BTN_NEUTRAL_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+@_theme_cached
+def _checkbox_qss(colors: dict) -> str:
+    """QSS for themed checkboxes."""
+    return _CHECKBOX_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+# Cache for generated spinbox arrow paths, keyed by color. Only the
+# paths need caching here: Qt's style engine caches the decoded image
+# behind a stylesheet url() itself, so each SVG is parsed once per
+# process no matter how many widgets share the sheet.
+_spin_arrow_cache: dict[str, tuple[str, str]] = {}
 
 
 def _get_spinbox_arrow_paths(color: str) -> tuple[str, str]:
-    """Generate up and down arrow SVG images for spinbox buttons.
+    """Get paths to up and down arrow SVG images for spinbox buttons.
 
-    Returns (up_path, down_path) with forward slashes for QSS url().
+    Creates the SVG files on first use per color; later calls return the
+    cached paths without touching the filesystem. Returns (up_path,
+    down_path) with forward slashes for QSS url().
     """
-    up_svg = (
-        '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="6" viewBox="0 0 10 6">'
-        f'<polygon points="5,0 10,6 0,6" fill="{color}"/>'
-        '</svg>'
-    )
-    down_svg = (
-        '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="6" viewBox="0 0 10 6">'
-        f'<polygon points="5,6 0,0 10,0" fill="{color}"/>'
-        '</svg>'
-    )
+    cached = _spin_arrow_cache.get(color)
+    if cached is not None:
+        return cached
+
+    color_safe = color.replace('#', '')
     tmp_dir = tempfile.gettempdir()
-    up_path = os.path.join(tmp_dir, 'todoui_spin_up.svg')
-    down_path = os.path.join(tmp_dir, 'todoui_spin_down.svg')
+    up_path = os.path.join(tmp_dir, f'todoui_spin_up_{color_safe}.svg')
+    down_path = os.path.join(tmp_dir, f'todoui_spin_down_{color_safe}.svg')
+
+    if not os.path.exists(up_path):
+        up_svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="6" viewBox="0 0 10 6">'
+            f'<polygon points="5,0 10,6 0,6" fill="{color}"/>'
+            '</svg>'
+        )
+        with open(up_path, 'w') as f:
+            f.write(up_svg)
+    if not os.path.exists(down_path):
+        down_svg = (
+            '<svg xmlns="http://www.w3.org/2000/svg" width="10" height="6" viewBox="0 0 10 6">'
+            f'<polygon points="5,6 0,0 10,0" fill="{color}"/>'
+            '</svg>'
+        )
+        with open(down_path, 'w') as f:
+            f.write(down_svg)
 
-    with open(up_path, 'w') as f:
-        f.write(up_svg)
-    with open(down_path, 'w') as f:
-        f.write(down_svg)
+    paths = up_path.replace('\\', '/'), down_path.replace('\\', '/')
+    _spin_arrow_cache[color] = paths
+    return paths
 
-    return up_path.replace('\\', '/'), down_path.replace('\\', '/')
+
+_SPINBOX_TMPL = Template("""
+        QSpinBox {
+            background-color: $bg_medium;
+            color: $text_primary;
+            border: 1px solid $separator;
+            border-radius: 6px;
+            padding: 4px 4px 4px 8px;
+            font-family: $font;
+            font-size: 12px;
+        }
+        QSpinBox::up-button, QSpinBox::down-button {
+            background-color: $bg_light;
+            border: none;
+            width: 18px;
+        }
+        QSpinBox::up-button {
+            border-top-right-radius: 6px;
+            border-bottom: 1px solid $separator;
+        }
+        QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+            background-color: $separator;
+        }
+        QSpinBox::down-button {
+            border-bottom-right-radius: 6px;
+        }
+        QSpinBox::up-arrow {
+            image: url($up_path);
+            width: 10px;
+            height: 6px;
+        }
+        QSpinBox::down-arrow {
+            image: url($down_path);
+            width: 10px;
+            height: 6px;
+        }
+    """)
+
+_DATEEDIT_TMPL = Template("""
+        QDateEdit {
+            background-color: $bg_medium;
+            color: $text_primary;
+            border: 1px solid $separator;
+            border-radius: 6px;
+            padding: 4px 8px;
+            font-family: $font;
+            font-size: 12px;
+        }
+        QDateEdit::drop-down {
+            border: none;
+            width: 20px;
+        }
+        QDateEdit QCalendarWidget {
+            background-color: $card_bg;
+            color: $text_primary;
+        }
+    """)
 
 
+@_theme_cached
 def _spinbox_qss(colors: dict) -> str:
     """QSS for themed spinboxes with visible arrow indicators."""
     up_path, down_path = _get_spinbox_arrow_paths(colors['text_primary'])
+    return _SPINBOX_TMPL.substitute(
+        colors, font=FONT_FAMILY, up_path=up_path, down_path=down_path)
+
+
+@_theme_cached
+def _dateedit_qss(colors: dict) -> str:
+    """QSS for themed date edits."""
+    return _DATEEDIT_TMPL.substitute(colors, font=FONT_FAMILY)
+
+
+def _repolish(widget: QWidget):
+    """Re-run style resolution after a dynamic property change."""
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+@_theme_cached
+def _task_rows_qss(colors: dict) -> str:
+    """Stylesheet for ProjectTaskWidget covering all its task rows.
+
+    Row widgets carry no stylesheets of their own; state changes flip
+    dynamic properties ("completed", "highlight") and repolish, so the
+    style engine resolves one parent sheet instead of one per row."""
     return f"""
-        QSpinBox {{
+        ProjectTaskWidget {{
+            background-color: {colors['container_bg']};
+            border-radius: 10px;
+        }}
+        TaskListItem {{
             background-color: {colors['bg_medium']};
-            color: {colors['text_primary']};
-            border: 1px solid {colors['separator']};
             border-radius: 6px;
-            padding: 4px 4px 4px 8px;
-            font-family: {FONT_FAMILY};
-            font-size: 12px;
         }}
-        QSpinBox::up-button, QSpinBox::down-button {{
+        TaskListItem[highlight="true"] {{
             background-color: {colors['bg_light']};
-            border: none;
-            width: 18px;
+            border: 1px solid {colors['success']};
         }}
-        QSpinBox::up-button {{
-            border-top-right-radius: 6px;
-            border-bottom: 1px solid {colors['separator']};
+        QLabel#taskTitle {{
+            color: {colors['text_primary']};
+            background: transparent;
         }}
-        QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
-            background-color: {colors['separator']};
+        TaskListItem[completed="true"] QLabel#taskTitle {{
+            color: {colors['text_secondary']};
+            text-decoration: line-through;
         }}
-        QSpinBox::down-button {{
-            border-bottom-right-radius: 6px;
+        QPushButton#taskDue, QPushButton#taskPriority {{
+            background-color: transparent;
+            color: {colors['text_secondary']};
+            border: 1px solid {colors['separator']};
+            border-radius: 4px;
+            padding: 2px 6px;
         }}
-        QSpinBox::up-arrow {{
-            image: url({up_path});
-            width: 10px;
-            height: 6px;
+        QPushButton#taskDue:hover, QPushButton#taskPriority:hover {{
+            background-color: {colors['bg_light']};
         }}
-        QSpinBox::down-arrow {{
-            image: url({down_path});
-            width: 10px;
-            height: 6px;
+        QPushButton#taskDelete {{
+            background-color: {colors['danger']};
+            color: #ffffff;
+            border: none;
+            border-radius: 4px;
+        }}
+        QPushButton#taskDelete:hover {{
+            background-color: {colors['danger_hover']};
         }}
+        {_checkbox_qss(colors)}
     """
 
 
-def _dateedit_qss(colors: dict) -> str:
-    """QSS for themed date edits."""
+@_theme_cached
+def _list_view_qss(colors: dict) -> str:
+    """Stylesheet shared by CalendarWidget and HistoryWidget.
+
+    One sheet per view covers the filter card, header, empty label, and
+    every row; the rows themselves carry no stylesheets, only object
+    names and an "overdue" property on the calendar's due label."""
     return f"""
-        QDateEdit {{
-            background-color: {colors['bg_medium']};
+        CalendarWidget, HistoryWidget {{
+            background: transparent;
+        }}
+        QFrame#filterCard {{
+            background-color: {colors['card_bg']};
+            border-radius: 8px;
+        }}
+        QFrame#listHeader {{
+            background-color: {colors['bg_light']};
+            border-radius: 6px;
+        }}
+        QLabel {{
+            background: transparent;
+        }}
+        QWidget#listContainer {{
+            background: transparent;
+        }}
+        QLabel#filterLabel {{
             color: {colors['text_primary']};
-            border: 1px solid {colors['separator']};
+        }}
+        QLabel#headerLabel, QLabel#emptyLabel {{
+            color: {colors['text_secondary']};
+        }}
+        CalendarTaskItem, HistoryTaskItem {{
+            background-color: {colors['bg_medium']};
             border-radius: 6px;
-            padding: 4px 8px;
-            font-family: {FONT_FAMILY};
-            font-size: 12px;
         }}
-        QDateEdit::drop-down {{
-            border: none;
-            width: 20px;
+        QLabel#rowDue, QLabel#rowTitle {{
+            color: {colors['text_primary']};
+        }}
+        QLabel#rowDue[overdue="true"] {{
+            color: {colors['danger']};
         }}
-        QDateEdit QCalendarWidget {{
+        QLabel#rowProj, QLabel#rowPri {{
+            color: {colors['text_secondary']};
+        }}
+        HistoryTaskItem QLabel#rowDue, HistoryTaskItem QLabel#rowTitle {{
+            color: {colors['text_secondary']};
+        }}
+    """
+
+
+@_theme_cached
+def _settings_qss(colors: dict) -> str:
+    """Stylesheet for SettingsWidget's groups and labels."""
+    return f"""
+        SettingsWidget {{
+            background: transparent;
+        }}
+        QFrame#groupCard {{
             background-color: {colors['card_bg']};
+            border-radius: 8px;
+        }}
+        QWidget#groupContent {{
+            background: transparent;
+        }}
+        QLabel#groupTitle {{
+            color: {colors['text_secondary']};
+            background-color: {colors['bg_light']};
+            border-top-left-radius: 8px;
+            border-top-right-radius: 8px;
+            padding: 6px 10px;
+        }}
+        QLabel#settingsLabel {{
             color: {colors['text_primary']};
+            background: transparent;
+        }}
+        QLabel#settingsNote {{
+            color: {colors['text_secondary']};
+            font-style: italic;
+            background: transparent;
         }}
     """
 
@@ -263,20 +476,20 @@ class NewProjectDialog(QDialog):
 
         # Name field
         name_label = QLabel("Project Name:")
-        name_label.setFont(QFont(FONT_FAMILY, 11))
+        name_label.setFont(get_font(11))
         name_label.setStyleSheet(f"color: {colors['text_primary']};")
         layout.addWidget(name_label)
 
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("Enter project name")
         self.name_edit.setStyleSheet(_input_qss(colors))
-        self.name_edit.setFont(QFont(FONT_FAMILY, 12))
+        self.name_edit.setFont(get_font(12))
         self.name_edit.setMinimumHeight(32)
         layout.addWidget(self.name_edit)
 
         # Description field
         desc_label = QLabel("Description (optional):")
-        desc_label.setFont(QFont(FONT_FAMILY, 11))
+        desc_label.setFont(get_font(11))
         desc_label.setStyleSheet(f"color: {colors['text_primary']};")
         layout.addWidget(desc_label)
 
@@ -379,6 +592,56 @@ class DueDateDialog(QDialog):
         return None
 
 
+class PriorityDialog(QDialog):
+    """Themed dialog for editing a task's priority."""
+
+    def __init__(self, current_priority: int = 0, parent=None):
+        super().__init__(parent)
+        colors = get_colors()
+
+        self.setWindowTitle("Set Priority")
+        self.setMinimumWidth(220)
+        self.setStyleSheet(f"background-color: {colors['bg_dark']};")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        label = QLabel("Priority (higher = lower urgency):")
+        label.setFont(get_font(11))
+        label.setStyleSheet(f"color: {colors['text_primary']};")
+        layout.addWidget(label)
+
+        self.priority_spin = QSpinBox()
+        self.priority_spin.setRange(-999, 999)
+        self.priority_spin.setValue(current_priority)
+        self.priority_spin.setStyleSheet(_spinbox_qss(colors))
+        self.priority_spin.setMinimumHeight(32)
+        layout.addWidget(self.priority_spin)
+
+        # Buttons
+        btn_row = QHBoxLayout()
+        btn_row.addStretch()
+
+        ok_btn = QPushButton("OK")
+        ok_btn.setStyleSheet(_btn_success(colors))
+        ok_btn.setMinimumHeight(32)
+        ok_btn.clicked.connect(self.accept)
+        btn_row.addWidget(ok_btn)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setStyleSheet(_btn_neutral(colors))
+        cancel_btn.setMinimumHeight(32)
+        cancel_btn.clicked.connect(self.reject)
+        btn_row.addWidget(cancel_btn)
+
+        layout.addLayout(btn_row)
+
+    def get_priority(self) -> int:
+        """Get the selected priority value."""
+        return self.priority_spin.value()
+
+
 class TaskListItem(QFrame):
     """Themed task row widget displayed in scroll area."""
 
@@ -390,15 +653,11 @@ class TaskListItem(QFrame):
     def __init__(self, task: Task, parent=None):
         super().__init__(parent)
         self.task = task
-        colors = get_colors()
 
-        # Style the frame as a themed row
-        self.setStyleSheet(f"""
-            TaskListItem {{
-                background-color: {colors['bg_medium']};
-                border-radius: 6px;
-            }}
-        """)
+        # All styling comes from the parent ProjectTaskWidget's sheet
+        # (_task_rows_qss); rows only carry dynamic properties
+        self.setProperty("completed", task.is_completed)
+        self.setProperty("highlight", False)
         self.setMinimumHeight(38)
 
         layout = QHBoxLayout(self)
@@ -408,55 +667,34 @@ class TaskListItem(QFrame):
         # Checkbox for completion
         self.checkbox = QCheckBox()
         self.checkbox.setChecked(task.is_completed)
-        self.checkbox.setStyleSheet(_checkbox_qss(colors))
         self.checkbox.stateChanged.connect(self._on_toggle)
         layout.addWidget(self.checkbox)
 
-        # Priority spinbox
-        self.priority_spin = QSpinBox()
-        self.priority_spin.setRange(-999, 999)
-        self.priority_spin.setValue(task.priority)
-        self.priority_spin.setMaximumWidth(60)
-        self.priority_spin.setToolTip("Priority (higher = lower urgency)")
-        self.priority_spin.setStyleSheet(_spinbox_qss(colors))
-        self.priority_spin.setKeyboardTracking(False)
+        # Priority button (click to edit, like the due date)
+        self.priority_btn = QPushButton(str(task.priority))
+        self.priority_btn.setObjectName("taskPriority")
+        self.priority_btn.setMaximumWidth(50)
+        self.priority_btn.setToolTip("Priority (higher = lower urgency); click to change")
+        self.priority_btn.setFont(get_font(10))
         if task.is_completed:
-            self.priority_spin.setEnabled(False)
-        self.priority_spin.valueChanged.connect(self._on_priority_changed)
-        layout.addWidget(self.priority_spin)
+            self.priority_btn.setEnabled(False)
+        self.priority_btn.clicked.connect(self._on_priority_clicked)
+        layout.addWidget(self.priority_btn)
 
         # Title label
         self.title_label = QLabel(task.title)
+        self.title_label.setObjectName("taskTitle")
         self.title_label.setWordWrap(True)
-        self.title_label.setFont(QFont(FONT_FAMILY, 12))
-        if task.is_completed:
-            self.title_label.setStyleSheet(
-                f"color: {colors['text_secondary']}; text-decoration: line-through; background: transparent;"
-            )
-        else:
-            self.title_label.setStyleSheet(
-                f"color: {colors['text_primary']}; background: transparent;"
-            )
+        self.title_label.setFont(get_font(12))
         layout.addWidget(self.title_label, 1)
 
         # Due date button
         due_text = task.due_date.strftime("%m/%d") if task.due_date else "..."
         self.due_btn = QPushButton(due_text)
+        self.due_btn.setObjectName("taskDue")
         self.due_btn.setMaximumWidth(50)
         self.due_btn.setToolTip("Click to set/change due date")
-        self.due_btn.setFont(QFont(FONT_FAMILY, 10))
-        self.due_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {colors['text_secondary']};
-                border: 1px solid {colors['separator']};
-                border-radius: 4px;
-                padding: 2px 6px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['bg_light']};
-            }}
-        """)
+        self.due_btn.setFont(get_font(10))
         if task.is_completed:
             self.due_btn.setEnabled(False)
         self.due_btn.clicked.connect(self._on_due_date_clicked)
@@ -464,20 +702,10 @@ class TaskListItem(QFrame):
 
         # Delete button
         delete_btn = QPushButton("X")
+        delete_btn.setObjectName("taskDelete")
         delete_btn.setFixedSize(38, 28)
-        delete_btn.setFont(QFont(FONT_FAMILY, 10, QFont.Weight.Bold))
-        delete_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {colors['danger']};
-                color: #ffffff;
-                border: none;
-                border-radius: 4px;
-            }}
-            QPushButton:hover {{
-                background-color: {colors['danger_hover']};
-            }}
-        """)
-        delete_btn.clicked.connect(lambda: self.deleted.emit(task.id))
+        delete_btn.setFont(get_font(10, QFont.Weight.Bold))
+        delete_btn.clicked.connect(lambda: self.deleted.emit(self.task.id))
         layout.addWidget(delete_btn)
 
     def _on_toggle(self, state):
@@ -485,31 +713,67 @@ class TaskListItem(QFrame):
         is_completed = state == Qt.CheckState.Checked.value
         self.toggled.emit(self.task.id, is_completed)
 
-    def _on_priority_changed(self, value):
-        """Handle priority spinbox change."""
-        self.priority_changed.emit(self.task.id, value)
+    def rebind(self, task: Task):
+        """Point a pooled row at a new task, updating children in place.
+
+        Used by ProjectTaskWidget's widget pool so a list rebuild reuses
+        existing rows instead of destroying and reconstructing them."""
+        self.task = task
+
+        self.priority_btn.setText(str(task.priority))
+        self.title_label.setText(task.title)
+        self.due_btn.setText(task.due_date.strftime("%m/%d") if task.due_date else "...")
+
+        self.set_completed(task.is_completed)
+        self._remove_highlight()
+
+    def set_due_date(self, due_date: Optional[datetime]):
+        """Update the due date and its button text in place."""
+        self.task.due_date = due_date
+        self.due_btn.setText(due_date.strftime("%m/%d") if due_date else "...")
+
+    def set_completed(self, is_completed: bool):
+        """Update the row in place after a completion toggle."""
+        self.task.is_completed = is_completed
+
+        self.checkbox.blockSignals(True)
+        self.checkbox.setChecked(is_completed)
+        self.checkbox.blockSignals(False)
+
+        self.priority_btn.setEnabled(not is_completed)
+        self.due_btn.setEnabled(not is_completed)
+
+        if bool(self.property("completed")) != is_completed:
+            self.setProperty("completed", is_completed)
+            # The strike-through rule matches the title on an ancestor
+            # property, so the child needs its own repolish
+            _repolish(self)
+            _repolish(self.title_label)
+
+    def _on_priority_clicked(self):
+        """Open the priority editor popup."""
+        dialog = PriorityDialog(self.task.priority, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            value = dialog.get_priority()
+            if value != self.task.priority:
+                self.priority_btn.setText(str(value))
+                self.priority_changed.emit(self.task.id, value)
 
     def highlight(self):
-        """Briefly highlight this task row to indicate it was repositioned."""
-        colors = get_colors()
-        self.setStyleSheet(f"""
-            TaskListItem {{
-                background-color: {colors['bg_light']};
-                border: 1px solid {colors['success']};
-                border-radius: 6px;
-            }}
-        """)
+        """Briefly highlight this task row to indicate it was repositioned.
+
+        Both the highlight and normal looks live in the parent sheet, so
+        toggling costs a property write and a repolish - no stylesheet
+        strings are built here."""
+        self.setProperty("highlight", True)
+        _repolish(self)
         QTimer.singleShot(1500, self._remove_highlight)
 
     def _remove_highlight(self):
         """Remove the highlight styling."""
-        colors = get_colors()
-        self.setStyleSheet(f"""
-            TaskListItem {{
-                background-color: {colors['bg_medium']};
-                border-radius: 6px;
-            }}
-        """)
+        if self.property("highlight"):
+            self.setProperty("highlight", False)
+            _repolish(self)
 
     def _on_due_date_clicked(self):
         """Open due date dialog."""
@@ -519,32 +783,101 @@ class TaskListItem(QFrame):
             self.due_date_changed.emit(self.task.id, new_date)
 
 
+# Cap on completed rows shown inline under a project; the History tab
+# has the full record
+_COMPLETED_LIMIT = 50
+
+
+class _TaskFetcher(QObject):
+    """Fetches a project's tasks on the thread pool.
+
+    The reader connections are pooled and cross-thread safe, and the
+    ready signal is emitted from the worker thread, so Qt queues the
+    delivery back onto the GUI thread automatically."""
+
+    ready = pyqtSignal(int, list, list)  # project_id, active, completed
+
+    def __init__(self, db: DatabaseManager, project_id: int):
+        super().__init__()
+        self._db = db
+        self._project_id = project_id
+
+    def run(self):
+        active, completed = self._db.get_tasks_partitioned(
+            self._project_id, completed_limit=_COMPLETED_LIMIT)
+        self.ready.emit(self._project_id, active, completed)
+
+
+class _ConfigSaver(QObject):
+    """Writes the config file on a pool thread.
+
+    The in-memory config is applied before this is started; only the
+    disk write is offloaded. The signal carries the exception on
+    failure (None on success) and always fires, so a disk-full or
+    permissions error surfaces in the GUI instead of dying silently on
+    the worker thread. Emission from the worker thread means delivery
+    to the GUI-thread receiver is automatically queued."""
+
+    done = pyqtSignal(object)
+
+    def __init__(self, config_manager):
+        super().__init__()
+        self._config_manager = config_manager
+
+    def run(self):
+        try:
+            self._config_manager.save()
+        except Exception as exc:
+            self.done.emit(exc)
+        else:
+            self.done.emit(None)
+
+
 class ProjectTaskWidget(QFrame):
-    """Themed widget for managing tasks within a project."""
+    """Themed widget for managing tasks within a project.
 
-    project_changed = pyqtSignal()
+    The task lists are real widgets rather than a virtualized
+    QListView/delegate: rows carry interactive children (checkbox,
+    popup editors, delete button), and with pooling, the lazy completed
+    section, and the inline completed cap the live row count stays
+    bounded, so virtualization would add delegate hit-testing and
+    painting code without a measurable win at this scale."""
+
+    project_changed = pyqtSignal(int)  # Carries the affected project id
     project_selected = pyqtSignal()
 
     def __init__(self, db: DatabaseManager, parent=None):
         super().__init__(parent)
         self.db = db
         self.current_project_id: Optional[int] = None
-        colors = get_colors()
-
-        # Outer container styling
-        self.setStyleSheet(f"""
-            ProjectTaskWidget {{
-                background-color: {colors['container_bg']};
-                border-radius: 10px;
-            }}
-        """)
+        self._task_widgets: dict[int, TaskListItem] = {}
+        self._widget_pool: list[TaskListItem] = []
+        self._project_ids: list[Optional[int]] = [None]
+        self._colors = get_colors()
+
+        # The completed section starts collapsed; its rows are built on
+        # first expand from the list cached by the last fetch
+        self._completed_collapsed = True
+        self._completed_built = False
+        self._completed_tasks: list[Task] = []
+
+        # Priority edits are debounced so holding a spinbox arrow turns
+        # into one DB write and one reposition per task
+        self._pending_priorities: dict[int, int] = {}
+        self._priority_timer = QTimer(self)
+        self._priority_timer.setSingleShot(True)
+        self._priority_timer.setInterval(150)
+        self._priority_timer.timeout.connect(self._flush_priority_changes)
+
+        # One sheet covers the container and every task row beneath it
+        self.setStyleSheet(_task_rows_qss(self._colors))
 
         self._setup_ui()
         self._refresh_projects()
 
     def _setup_ui(self):
         """Set up the widget UI with theme styling."""
-        colors = get_colors()
+        colors = self._colors
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -578,7 +911,7 @@ class ProjectTaskWidget(QFrame):
 
         # ── Active Tasks section ──
         active_header = QLabel("Active Tasks")
-        active_header.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
+        active_header.setFont(get_font(11, QFont.Weight.Bold))
         active_header.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
         layout.addWidget(active_header)
 
@@ -605,11 +938,21 @@ class ProjectTaskWidget(QFrame):
         self.active_scroll.setWidget(self.active_container)
         layout.addWidget(self.active_scroll, 2)
 
-        # ── Completed Tasks section ──
-        completed_header = QLabel("Completed")
-        completed_header.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
-        completed_header.setStyleSheet(f"color: {colors['text_secondary']}; background: transparent;")
-        layout.addWidget(completed_header)
+        # ── Completed Tasks section (collapsed until first expand) ──
+        self.completed_toggle = QPushButton("▸ Completed")
+        self.completed_toggle.setCheckable(True)
+        self.completed_toggle.setFont(get_font(11, QFont.Weight.Bold))
+        self.completed_toggle.setStyleSheet(f"""
+            QPushButton {{
+                background: transparent;
+                border: none;
+                color: {colors['text_secondary']};
+                text-align: left;
+                padding: 2px 0;
+            }}
+        """)
+        self.completed_toggle.toggled.connect(self._toggle_completed)
+        layout.addWidget(self.completed_toggle)
 
         # Completed tasks scroll area
         self.completed_scroll = QScrollArea()
@@ -631,6 +974,7 @@ class ProjectTaskWidget(QFrame):
         self.completed_layout.setSpacing(4)
         self.completed_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.completed_scroll.setWidget(self.completed_container)
+        self.completed_scroll.setVisible(False)
         layout.addWidget(self.completed_scroll, 1)
 
         # ── Add task row (card) ──
@@ -698,74 +1042,142 @@ class ProjectTaskWidget(QFrame):
 
         layout.addLayout(mgmt_row)
 
-    def _refresh_projects(self):
-        """Refresh the project dropdown."""
+    def _refresh_projects(self, refresh_tasks: bool = True):
+        """Refresh the project dropdown.
+
+        With refresh_tasks False the dropdown reloads but an unchanged
+        selection keeps its task lists instead of rebuilding them."""
         self.project_combo.blockSignals(True)
         current_id = self.current_project_id
 
-        self.project_combo.clear()
-        self.project_combo.addItem("-- Select Project --", None)
-
         projects = self.db.get_projects(include_archived=False)
-        selected_index = 0
 
-        for i, project in enumerate(projects):
-            self.project_combo.addItem(project.name, project.id)
-            if project.id == current_id:
-                selected_index = i + 1
+        # Repopulate in one addItems call; ids live in a parallel list
+        # so the combo model never stores per-item user data
+        self._project_ids = [None] + [p.id for p in projects]
+        self.project_combo.clear()
+        self.project_combo.addItems(
+            ["-- Select Project --"] + [p.name for p in projects]
+        )
+
+        try:
+            selected_index = self._project_ids.index(current_id) if current_id is not None else 0
+        except ValueError:
+            selected_index = 0
 
         self.project_combo.setCurrentIndex(selected_index)
         self.project_combo.blockSignals(False)
 
         if selected_index > 0:
-            self._on_project_selected(selected_index)
+            if refresh_tasks:
+                self._on_project_selected(selected_index)
         else:
             self.current_project_id = None
             self._clear_tasks()
 
     def _on_project_selected(self, index: int):
         """Handle project selection change."""
-        project_id = self.project_combo.itemData(index)
+        project_id = self._project_ids[index] if 0 <= index < len(self._project_ids) else None
         self.current_project_id = project_id
         self._refresh_tasks()
         self.project_selected.emit()
 
     def _refresh_tasks(self):
-        """Refresh the task lists using scroll area layout."""
-        self._clear_tasks()
+        """Refresh the task lists, fetching off the GUI thread.
 
+        The previous rows stay visible until the fetch lands; the result
+        slot discards fetches whose project is no longer selected."""
         if self.current_project_id is None:
+            self._clear_tasks()
             return
 
-        tasks = self.db.get_tasks(self.current_project_id)
+        fetcher = _TaskFetcher(self.db, self.current_project_id)
+        fetcher.ready.connect(self._populate_tasks)
+        self._task_fetcher = fetcher  # keep a ref while the job runs
+        QThreadPool.globalInstance().start(fetcher.run)
+
+    def _populate_tasks(self, project_id: int, active: list, completed: list):
+        """Rebuild the task rows from a fetch result (GUI thread)."""
+        if project_id != self.current_project_id:
+            return  # stale: selection changed while the fetch ran
+
+        self._clear_tasks()
+        self._completed_tasks = completed
 
         with batch_update(self.active_container):
-            with batch_update(self.completed_container):
-                for task in tasks:
-                    widget = TaskListItem(task)
-                    widget.toggled.connect(self._on_task_toggled)
-                    widget.deleted.connect(self._on_task_deleted)
-                    widget.priority_changed.connect(self._on_task_priority_changed)
-                    widget.due_date_changed.connect(self._on_task_due_date_changed)
-
-                    if task.is_completed:
-                        self.completed_layout.addWidget(widget)
-                    else:
-                        self.active_layout.addWidget(widget)
+            for task in active:
+                widget = self._bind_row(task)
+                self.active_layout.addWidget(widget)
+                widget.show()
+
+        if not self._completed_collapsed:
+            self._populate_completed()
+
+    def _populate_completed(self):
+        """Build rows for the completed section (deferred while collapsed)."""
+        with batch_update(self.completed_container):
+            for task in self._completed_tasks:
+                widget = self._bind_row(task)
+                self.completed_layout.addWidget(widget)
+                widget.show()
+        self._completed_built = True
+
+    def _toggle_completed(self, expanded: bool):
+        """Show or hide the completed section, building it on first use."""
+        self._completed_collapsed = not expanded
+        self.completed_toggle.setText("▾ Completed" if expanded else "▸ Completed")
+        self.completed_scroll.setVisible(expanded)
+        if expanded and not self._completed_built:
+            self._populate_completed()
+
+    def _bind_row(self, task: Task) -> TaskListItem:
+        """Get a row for a task, from the pool when possible."""
+        if self._widget_pool:
+            widget = self._widget_pool.pop()
+            widget.rebind(task)
+        else:
+            widget = TaskListItem(task)
+            widget.toggled.connect(self._on_task_toggled)
+            widget.deleted.connect(self._on_task_deleted)
+            widget.priority_changed.connect(self._on_task_priority_changed)
+            widget.due_date_changed.connect(self._on_task_due_date_changed)
+        self._task_widgets[task.id] = widget
+        return widget
+
+    def _insert_task_widget(self, widget: TaskListItem):
+        """Insert a task row into its layout at the sorted position.
+
+        Both layouts keep the DB order (priority, then creation time), so
+        a relocated row can find its slot with one linear scan instead of
+        a full rebuild."""
+        task = widget.task
+        layout = self.completed_layout if task.is_completed else self.active_layout
+        key = (task.priority, task.created_at)
+
+        index = layout.count()
+        for i in range(layout.count()):
+            other = layout.itemAt(i).widget()
+            if other is not None and (other.task.priority, other.task.created_at) > key:
+                index = i
+                break
+        layout.insertWidget(index, widget)
+        widget.show()
 
     def _clear_tasks(self):
-        """Clear both task scroll areas."""
-        # Clear active tasks
-        while self.active_layout.count():
-            item = self.active_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
-
-        # Clear completed tasks
-        while self.completed_layout.count():
-            item = self.completed_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+        """Clear both task scroll areas, parking rows in the widget pool."""
+        self._task_widgets.clear()
+        self._completed_built = False
+
+        # Pooled rows stay parented to their container (hidden, out of
+        # the layout) so they are destroyed with this widget. Taking from
+        # the tail avoids reindexing the remaining items on every pop.
+        for layout in (self.active_layout, self.completed_layout):
+            for i in range(layout.count() - 1, -1, -1):
+                item = layout.takeAt(i)
+                widget = item.widget() if item else None
+                if widget is not None:
+                    widget.hide()
+                    self._widget_pool.append(widget)
 
     def _create_project(self):
         """Open dialog to create a new project."""
@@ -775,7 +1187,7 @@ class ProjectTaskWidget(QFrame):
             if name:
                 project = self.db.create_project(name, desc)
                 self.current_project_id = project.id
-                self.project_changed.emit()
+                self.project_changed.emit(project.id)
 
     def _add_task(self):
         """Add a new task to the current project."""
@@ -794,46 +1206,107 @@ class ProjectTaskWidget(QFrame):
             qdate = self.date_edit.date()
             due_date = datetime(qdate.year(), qdate.month(), qdate.day())
 
-        self.db.create_task(self.current_project_id, title, priority, due_date)
+        task = self.db.create_task(self.current_project_id, title, priority, due_date)
 
         # Reset inputs
         self.title_edit.clear()
         self.priority_spin.setValue(get_config().default_priority)
         self.use_date_check.setChecked(False)
 
-        self._refresh_tasks()
+        # create_task returns the full row, so insert it directly at its
+        # sorted slot instead of refetching the project
+        widget = self._bind_row(task)
+        self._insert_task_widget(widget)
 
     def _on_task_toggled(self, task_id: int, is_completed: bool):
-        """Handle task completion toggle."""
+        """Handle task completion toggle: move only the affected row."""
         if is_completed:
             self.db.complete_task(task_id)
         else:
             self.db.uncomplete_task(task_id)
-        self._refresh_tasks()
+
+        widget = self._task_widgets.get(task_id)
+        if widget is None:
+            self._refresh_tasks()
+            return
+
+        widget.set_completed(is_completed)
+        if is_completed and not self._completed_built:
+            # Completed section hasn't been built: park the row and
+            # record the task so a later expand includes it
+            del self._task_widgets[task_id]
+            self.active_layout.removeWidget(widget)
+            widget.hide()
+            self._widget_pool.append(widget)
+            self._insert_completed_task(widget.task)
+        else:
+            widget.setParent(None)
+            self._insert_task_widget(widget)
+
+    def _insert_completed_task(self, task: Task):
+        """Record a newly completed task in the deferred-build list."""
+        key = (task.priority, task.created_at)
+        for i, other in enumerate(self._completed_tasks):
+            if (other.priority, other.created_at) > key:
+                self._completed_tasks.insert(i, task)
+                return
+        self._completed_tasks.append(task)
 
     def _on_task_deleted(self, task_id: int):
-        """Handle task deletion."""
+        """Handle task deletion: drop only the affected row."""
         self.db.delete_task(task_id)
-        self._refresh_tasks()
+
+        widget = self._task_widgets.pop(task_id, None)
+        if widget is None:
+            self._refresh_tasks()
+            return
+
+        layout = self.completed_layout if widget.task.is_completed else self.active_layout
+        layout.removeWidget(widget)
+        widget.hide()
+        self._widget_pool.append(widget)
 
     def _on_task_priority_changed(self, task_id: int, new_priority: int):
-        """Handle task priority change - update DB, reposition, and highlight."""
-        self.db.update_task(task_id, priority=new_priority)
-        self._refresh_tasks()
+        """Record a priority change; applied after a short debounce."""
+        self._pending_priorities[task_id] = new_priority
+        self._priority_timer.start()
+
+    def _flush_priority_changes(self):
+        """Write coalesced priority changes and reposition their rows."""
+        pending, self._pending_priorities = self._pending_priorities, {}
+        if not pending:
+            return
+
+        self.db.update_tasks_bulk(
+            [(task_id, {"priority": priority}) for task_id, priority in pending.items()]
+        )
+
+        if not all(task_id in self._task_widgets for task_id in pending):
+            self._refresh_tasks()  # e.g. the project changed mid-debounce
+            return
 
-        # Find the repositioned task widget and highlight it
-        for i in range(self.active_layout.count()):
-            item = self.active_layout.itemAt(i)
-            if item and item.widget() and isinstance(item.widget(), TaskListItem):
-                if item.widget().task.id == task_id:
-                    item.widget().highlight()
-                    self.active_scroll.ensureWidgetVisible(item.widget())
-                    break
+        # Reposition only the changed rows (the priority editor is
+        # disabled on completed tasks, so these are all active rows)
+        for task_id, priority in pending.items():
+            widget = self._task_widgets[task_id]
+            widget.task.priority = priority
+            widget.setParent(None)
+            self._insert_task_widget(widget)
+            widget.highlight()
+        self.active_scroll.ensureWidgetVisible(widget)
 
     def _on_task_due_date_changed(self, task_id: int, new_due_date):
-        """Handle task due date change."""
+        """Handle task due date change: update the row in place.
+
+        Due dates don't participate in list ordering, so no move is
+        needed."""
         self.db.update_task(task_id, due_date=new_due_date)
-        self._refresh_tasks()
+
+        widget = self._task_widgets.get(task_id)
+        if widget is None:
+            self._refresh_tasks()
+            return
+        widget.set_due_date(new_due_date)
 
     def _archive_project(self):
         """Archive the current project."""
@@ -845,9 +1318,10 @@ class ProjectTaskWidget(QFrame):
             "Are you sure you want to archive this project?"
         )
         if dialog.get_result():
-            self.db.archive_project(self.current_project_id)
+            project_id = self.current_project_id
+            self.db.archive_project(project_id)
             self.current_project_id = None
-            self.project_changed.emit()
+            self.project_changed.emit(project_id)
 
     def _delete_project(self):
         """Delete the current project."""
@@ -859,21 +1333,27 @@ class ProjectTaskWidget(QFrame):
             "Are you sure you want to permanently delete this project and all its tasks?"
         )
         if dialog.get_result():
-            self.db.delete_project(self.current_project_id)
+            project_id = self.current_project_id
+            self.db.delete_project(project_id)
             self.current_project_id = None
-            self.project_changed.emit()
+            self.project_changed.emit(project_id)
 
     def set_project_by_id(self, project_id: int):
         """Select a project by its ID. Falls back to '-- Select Project --' if not found."""
-        for i in range(self.project_combo.count()):
-            if self.project_combo.itemData(i) == project_id:
-                self.project_combo.setCurrentIndex(i)
-                return
-        self.project_combo.setCurrentIndex(0)
+        try:
+            index = self._project_ids.index(project_id)
+        except ValueError:
+            index = 0
+        self.project_combo.setCurrentIndex(index)
 
-    def refresh_from_external(self):
-        """Refresh widget data (called when other widgets modify data)."""
-        self._refresh_projects()
+    def refresh_from_external(self, changed_project_id: int = -1):
+        """Refresh widget data (called when other widgets modify data).
+
+        The project dropdown always reloads, since any change may add or
+        remove entries; the task lists rebuild only when this widget is
+        showing the project that changed (or no id was given)."""
+        affected = changed_project_id in (-1, self.current_project_id)
+        self._refresh_projects(refresh_tasks=affected)
 
 
 class SettingsWidget(QWidget):
@@ -891,7 +1371,7 @@ class SettingsWidget(QWidget):
         """Set up the settings UI with theme styling."""
         colors = get_colors()
 
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(_settings_qss(colors))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -904,8 +1384,8 @@ class SettingsWidget(QWidget):
         theme_layout.setSpacing(8)
 
         theme_label = QLabel("Color theme:")
-        theme_label.setFont(QFont(FONT_FAMILY, 11))
-        theme_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        theme_label.setFont(get_font(11))
+        theme_label.setObjectName("settingsLabel")
         theme_layout.addWidget(theme_label)
 
         self.theme_combo = QComboBox()
@@ -929,8 +1409,8 @@ class SettingsWidget(QWidget):
         frame_layout.setSpacing(8)
 
         frame_label = QLabel("Number of task frames:")
-        frame_label.setFont(QFont(FONT_FAMILY, 11))
-        frame_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        frame_label.setFont(get_font(11))
+        frame_label.setObjectName("settingsLabel")
         frame_layout.addWidget(frame_label)
 
         self.frame_spin = QSpinBox()
@@ -951,8 +1431,8 @@ class SettingsWidget(QWidget):
         priority_layout.setSpacing(8)
 
         priority_label = QLabel("Default priority:")
-        priority_label.setFont(QFont(FONT_FAMILY, 11))
-        priority_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        priority_label.setFont(get_font(11))
+        priority_label.setObjectName("settingsLabel")
         priority_layout.addWidget(priority_label)
 
         self.default_priority_spin = QSpinBox()
@@ -975,8 +1455,8 @@ class SettingsWidget(QWidget):
         # Database path row
         db_path_row = QHBoxLayout()
         db_path_label = QLabel("Database path:")
-        db_path_label.setFont(QFont(FONT_FAMILY, 11))
-        db_path_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        db_path_label.setFont(get_font(11))
+        db_path_label.setObjectName("settingsLabel")
         db_path_row.addWidget(db_path_label)
 
         self.db_path_edit = QLineEdit()
@@ -995,8 +1475,8 @@ class SettingsWidget(QWidget):
         # Backup path row
         backup_path_row = QHBoxLayout()
         backup_label = QLabel("Backup path:")
-        backup_label.setFont(QFont(FONT_FAMILY, 11))
-        backup_label.setStyleSheet(f"color: {colors['text_primary']}; background: transparent;")
+        backup_label.setFont(get_font(11))
+        backup_label.setObjectName("settingsLabel")
         backup_path_row.addWidget(backup_label)
 
         self.backup_path_edit = QLineEdit()
@@ -1016,8 +1496,8 @@ class SettingsWidget(QWidget):
 
         # Note about restart
         note_label = QLabel("Note: Database and backup path changes require application restart.")
-        note_label.setFont(QFont(FONT_FAMILY, 10))
-        note_label.setStyleSheet(f"color: {colors['text_secondary']}; font-style: italic; background: transparent;")
+        note_label.setFont(get_font(10))
+        note_label.setObjectName("settingsNote")
         layout.addWidget(note_label)
 
         # Apply button
@@ -1039,33 +1519,20 @@ class SettingsWidget(QWidget):
         Returns (outer_frame, content_widget) - add outer_frame to parent layout,
         set your layout on content_widget.
         """
-        colors = get_colors()
-
         frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['card_bg']};
-                border-radius: 8px;
-            }}
-        """)
+        frame.setObjectName("groupCard")
 
         outer_layout = QVBoxLayout(frame)
         outer_layout.setContentsMargins(0, 0, 0, 0)
         outer_layout.setSpacing(0)
 
         title_label = QLabel(f"  {title}")
-        title_label.setFont(QFont(FONT_FAMILY, 10, QFont.Weight.Bold))
-        title_label.setStyleSheet(f"""
-            color: {colors['text_secondary']};
-            background-color: {colors['bg_light']};
-            border-top-left-radius: 8px;
-            border-top-right-radius: 8px;
-            padding: 6px 10px;
-        """)
+        title_label.setFont(get_font(10, QFont.Weight.Bold))
+        title_label.setObjectName("groupTitle")
         outer_layout.addWidget(title_label)
 
         content = QWidget()
-        content.setStyleSheet("background: transparent;")
+        content.setObjectName("groupContent")
         outer_layout.addWidget(content)
 
         return frame, content
@@ -1093,32 +1560,19 @@ class SettingsWidget(QWidget):
 
     def _apply_settings(self):
         """Apply and save settings changes."""
-        new_frame_count = self.frame_spin.value()
-        new_db_path = self.db_path_edit.text().strip()
-        new_backup_path = self.backup_path_edit.text().strip()
-        new_default_priority = self.default_priority_spin.value()
-        new_theme = self.theme_combo.currentData()
-
-        changes = {}
-        needs_restart = False
-
-        # Check what changed
-        if new_frame_count != self.config.frame_count:
-            changes['frame_count'] = new_frame_count
-
-        if new_default_priority != self.config.default_priority:
-            changes['default_priority'] = new_default_priority
-
-        if new_db_path != self.config.database_path:
-            changes['database_path'] = new_db_path
-            needs_restart = True
-
-        if new_backup_path != self.config.backup_path:
-            changes['backup_path'] = new_backup_path
-            needs_restart = True
-
-        if new_theme != self.config.theme:
-            changes['theme'] = new_theme
+        # Diff the form against the live config; keys match Config fields
+        candidates = {
+            'frame_count': self.frame_spin.value(),
+            'default_priority': self.default_priority_spin.value(),
+            'database_path': self.db_path_edit.text().strip(),
+            'backup_path': self.backup_path_edit.text().strip(),
+            'theme': self.theme_combo.currentData(),
+        }
+        changes = {
+            key: value for key, value in candidates.items()
+            if value != getattr(self.config, key)
+        }
+        needs_restart = bool(changes.keys() & {'database_path', 'backup_path'})
 
         if not changes:
             MessageBox(self, "Settings", "No changes to apply.")
@@ -1139,12 +1593,31 @@ class SettingsWidget(QWidget):
         if 'theme' in changes:
             set_theme(changes['theme'])
 
-        # Save changes
-        self.config_manager.update(**changes)
+        # Apply in memory now; the file write happens on a pool thread
+        # so the click handler isn't blocked on disk I/O
+        self.config_manager.apply(**changes)
 
         # Emit signal with changes
         self.settings_changed.emit(changes)
 
+        saver = _ConfigSaver(self.config_manager)
+        saver.done.connect(
+            lambda error: self._on_settings_saved(error, needs_restart)
+        )
+        # Keep a reference so the QObject outlives the worker run
+        self._config_saver = saver
+        QThreadPool.globalInstance().start(saver.run)
+
+    def _on_settings_saved(self, error, needs_restart: bool):
+        """Confirm (or report) the save once the worker has finished."""
+        self._config_saver = None
+        if error is not None:
+            MessageBox(
+                self, "Settings Error",
+                "Settings were applied but could not be saved to disk:\n"
+                f"{error}"
+            )
+            return
         if needs_restart:
             MessageBox(
                 self, "Settings Saved",
@@ -1157,16 +1630,9 @@ class SettingsWidget(QWidget):
 class CalendarTaskItem(QFrame):
     """Read-only task row for the Calendar view."""
 
-    def __init__(self, task: Task, project_name: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        colors = get_colors()
 
-        self.setStyleSheet(f"""
-            CalendarTaskItem {{
-                background-color: {colors['bg_medium']};
-                border-radius: 6px;
-            }}
-        """)
         self.setMinimumHeight(38)
 
         layout = QHBoxLayout(self)
@@ -1174,61 +1640,79 @@ class CalendarTaskItem(QFrame):
         layout.setSpacing(6)
 
         # Due date label
-        due_text = task.due_date.strftime("%m/%d/%Y") if task.due_date else ""
-        due_label = QLabel(due_text)
-        due_label.setFixedWidth(80)
-        due_label.setFont(QFont(FONT_FAMILY, 11))
-        # Red if overdue
-        if task.due_date and task.due_date.date() < datetime.now().date():
-            due_label.setStyleSheet(
-                f"color: {colors['danger']}; background: transparent;"
-            )
-        else:
-            due_label.setStyleSheet(
-                f"color: {colors['text_primary']}; background: transparent;"
-            )
-        layout.addWidget(due_label)
+        self.due_label = QLabel()
+        self.due_label.setObjectName("rowDue")
+        self.due_label.setFixedWidth(80)
+        self.due_label.setFont(get_font(11))
+        layout.addWidget(self.due_label)
 
         # Project name label
-        proj_label = QLabel(project_name)
-        proj_label.setFixedWidth(120)
-        proj_label.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
-        proj_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(proj_label)
+        self.proj_label = QLabel()
+        self.proj_label.setFixedWidth(120)
+        self.proj_label.setFont(get_font(11, QFont.Weight.Bold))
+        self.proj_label.setObjectName("rowProj")
+        layout.addWidget(self.proj_label)
 
         # Priority label
-        pri_label = QLabel(str(task.priority))
-        pri_label.setFixedWidth(45)
-        pri_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        pri_label.setFont(QFont(FONT_FAMILY, 11))
-        pri_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(pri_label)
+        self.pri_label = QLabel()
+        self.pri_label.setFixedWidth(45)
+        self.pri_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pri_label.setFont(get_font(11))
+        self.pri_label.setObjectName("rowPri")
+        layout.addWidget(self.pri_label)
 
         # Title label
-        title_label = QLabel(task.title)
-        title_label.setWordWrap(True)
-        title_label.setFont(QFont(FONT_FAMILY, 12))
-        title_label.setStyleSheet(
-            f"color: {colors['text_primary']}; background: transparent;"
-        )
-        layout.addWidget(title_label, 1)
+        self.title_label = QLabel()
+        self.title_label.setWordWrap(True)
+        self.title_label.setFont(get_font(12))
+        self.title_label.setObjectName("rowTitle")
+        layout.addWidget(self.title_label, 1)
+
+    def set_task(self, task: Task, project_name: str, due_str: str, today):
+        """Point this row at a task (rows are pooled across refreshes).
+
+        due_str arrives pre-formatted from the query and today is passed
+        in, so a refresh does no per-row date formatting or clock reads.
+        """
+        self.due_label.setText(due_str or "")
+        # Red if overdue, via the parent sheet's [overdue] property rule
+        overdue = bool(task.due_date and task.due_date.date() < today)
+        if bool(self.due_label.property("overdue")) != overdue:
+            self.due_label.setProperty("overdue", overdue)
+            _repolish(self.due_label)
+        self.proj_label.setText(project_name)
+        self.pri_label.setText(str(task.priority))
+        self.title_label.setText(task.title)
 
 
 class CalendarWidget(QWidget):
-    """Calendar view showing all tasks with due dates sorted chronologically."""
+    """Calendar view showing all tasks with due dates sorted chronologically.
+
+    Like the task panels, the list is plain widgets rather than a
+    QListView/delegate - see the note on ProjectTaskWidget; the same
+    trade-off applies here, with row pooling keeping rebuilds cheap.
+    Each row also stays its own framed widget rather than loose labels
+    in one container-level grid: the themed row background/rounding
+    hangs off the row frame, and pooling rebinds whole rows, neither
+    of which survives flattening the rows into a shared layout."""
 
     def __init__(self, db: DatabaseManager, parent=None):
         super().__init__(parent)
         self.db = db
+        self._row_pool: list = []
+        # Parallel to filter_combo rows: entry 0 is the "All Projects" item.
+        self._filter_ids: list = [None]
+        # Debounce filter changes so scrolling through the dropdown with
+        # the keyboard does not refresh the list for every intermediate item
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
+        self._filter_timer.timeout.connect(self._refresh_tasks)
         self._setup_ui()
 
     def _setup_ui(self):
         colors = get_colors()
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(_list_view_qss(colors))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -1236,22 +1720,15 @@ class CalendarWidget(QWidget):
 
         # Filter card
         filter_card = QFrame()
-        filter_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['card_bg']};
-                border-radius: 8px;
-            }}
-        """)
+        filter_card.setObjectName("filterCard")
         filter_card.setMaximumHeight(42)
         filter_layout = QHBoxLayout(filter_card)
         filter_layout.setContentsMargins(10, 4, 10, 4)
         filter_layout.setSpacing(8)
 
         filter_label = QLabel("Project:")
-        filter_label.setFont(QFont(FONT_FAMILY, 11))
-        filter_label.setStyleSheet(
-            f"color: {colors['text_primary']}; background: transparent;"
-        )
+        filter_label.setFont(get_font(11))
+        filter_label.setObjectName("filterLabel")
         filter_layout.addWidget(filter_label)
 
         self.filter_combo = QComboBox()
@@ -1265,12 +1742,7 @@ class CalendarWidget(QWidget):
 
         # Column header row
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['bg_light']};
-                border-radius: 6px;
-            }}
-        """)
+        header_frame.setObjectName("listHeader")
         header_frame.setFixedHeight(28)
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(8, 2, 8, 2)
@@ -1281,10 +1753,8 @@ class CalendarWidget(QWidget):
             ("Priority", 45, 0), ("Title", 0, 1)
         ]:
             lbl = QLabel(text)
-            lbl.setFont(QFont(FONT_FAMILY, 10, QFont.Weight.Bold))
-            lbl.setStyleSheet(
-                f"color: {colors['text_secondary']}; background: transparent;"
-            )
+            lbl.setFont(get_font(10, QFont.Weight.Bold))
+            lbl.setObjectName("headerLabel")
             if width:
                 lbl.setFixedWidth(width)
             if text == "Pri":
@@ -1314,7 +1784,7 @@ class CalendarWidget(QWidget):
         """)
 
         self.list_container = QWidget()
-        self.list_container.setStyleSheet("background: transparent;")
+        self.list_container.setObjectName("listContainer")
         self.list_layout = QVBoxLayout(self.list_container)
         self.list_layout.setContentsMargins(0, 0, 0, 0)
         self.list_layout.setSpacing(4)
@@ -1325,47 +1795,61 @@ class CalendarWidget(QWidget):
         # Empty state label (hidden by default)
         self.empty_label = QLabel("No tasks with due dates")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setFont(QFont(FONT_FAMILY, 13))
-        self.empty_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
+        self.empty_label.setFont(get_font(13))
+        self.empty_label.setObjectName("emptyLabel")
         self.empty_label.setVisible(False)
         layout.addWidget(self.empty_label)
 
     def refresh(self):
-        """Rebuild filter dropdown (preserving selection) and task list."""
-        # Remember current filter selection
-        current_data = self.filter_combo.currentData()
+        """Rebuild filter dropdown (preserving selection) and task list.
 
-        self.filter_combo.blockSignals(True)
-        self.filter_combo.clear()
-        self.filter_combo.addItem("All Projects", None)
+        Only called while the view is showing: MainWindow marks hidden
+        data tabs dirty and defers this to the next visit, so nothing
+        here needs to check visibility.
+        """
+        # Remember current filter selection
+        current_id = self._selected_project_id()
 
         projects = self.db.get_projects(include_archived=False)
-        selected_index = 0
-        for i, project in enumerate(projects):
-            self.filter_combo.addItem(project.name, project.id)
-            if project.id == current_data:
-                selected_index = i + 1
 
-        self.filter_combo.setCurrentIndex(selected_index)
+        self.filter_combo.blockSignals(True)
+        self.filter_combo.clear()
+        self._filter_ids = [None] + [p.id for p in projects]
+        self.filter_combo.addItems(["All Projects"] + [p.name for p in projects])
+        try:
+            self.filter_combo.setCurrentIndex(self._filter_ids.index(current_id))
+        except ValueError:
+            self.filter_combo.setCurrentIndex(0)
         self.filter_combo.blockSignals(False)
 
         self._refresh_tasks()
 
+    def _selected_project_id(self) -> Optional[int]:
+        """Project id for the current filter selection (None = all)."""
+        index = self.filter_combo.currentIndex()
+        if 0 <= index < len(self._filter_ids):
+            return self._filter_ids[index]
+        return None
+
     def _on_filter_changed(self, _index: int):
-        self._refresh_tasks()
+        self._filter_timer.start()
 
     def _refresh_tasks(self):
-        """Clear and repopulate the task list from DB."""
-        # Clear existing items
+        """Clear and repopulate the task list from DB.
+
+        Rows are pooled rather than destroyed: cleared rows are hidden
+        (still parented to the container) and rebound via set_task on
+        the next refresh, so filter changes churn no widgets."""
+        # Return existing rows to the pool
         while self.list_layout.count():
             item = self.list_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                self._row_pool.append(widget)
 
-        project_id = self.filter_combo.currentData()
-        tasks = self.db.get_tasks_with_due_dates(project_id)
+        project_id = self._selected_project_id()
+        tasks = self.db.get_tasks_with_due_dates_named(project_id)
 
         if not tasks:
             self.empty_label.setVisible(True)
@@ -1375,30 +1859,31 @@ class CalendarWidget(QWidget):
         self.empty_label.setVisible(False)
         self.scroll.setVisible(True)
 
-        # Build project name lookup
-        projects = self.db.get_projects(include_archived=False)
-        proj_names = {p.id: p.name for p in projects}
-
-        with batch_update(self.list_container):
-            for task in tasks:
-                name = proj_names.get(task.project_id, "?")
-                item = CalendarTaskItem(task, name)
-                self.list_layout.addWidget(item)
+        today = datetime.now().date()
+        # batch_update suppresses repaints; disabling the layout also
+        # defers geometry recalculation until all rows are in place
+        self.list_layout.setEnabled(False)
+        try:
+            with batch_update(self.list_container):
+                for task, name, due_str in tasks:
+                    if self._row_pool:
+                        row = self._row_pool.pop()
+                    else:
+                        row = CalendarTaskItem(self.list_container)
+                    row.set_task(task, name, due_str, today)
+                    self.list_layout.addWidget(row)
+                    row.show()
+        finally:
+            self.list_layout.setEnabled(True)
+            self.list_layout.activate()
 
 
 class HistoryTaskItem(QFrame):
     """Read-only task row for the History view."""
 
-    def __init__(self, task: Task, project_name: str, parent=None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        colors = get_colors()
 
-        self.setStyleSheet(f"""
-            HistoryTaskItem {{
-                background-color: {colors['bg_medium']};
-                border-radius: 6px;
-            }}
-        """)
         self.setMinimumHeight(38)
 
         layout = QHBoxLayout(self)
@@ -1406,45 +1891,44 @@ class HistoryTaskItem(QFrame):
         layout.setSpacing(6)
 
         # Completed date label
-        completed_text = (
-            task.completed_at.strftime("%m/%d/%Y")
-            if task.completed_at else "—"
-        )
-        date_label = QLabel(completed_text)
-        date_label.setFixedWidth(80)
-        date_label.setFont(QFont(FONT_FAMILY, 11))
-        date_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(date_label)
+        self.date_label = QLabel()
+        self.date_label.setFixedWidth(80)
+        self.date_label.setFont(get_font(11))
+        self.date_label.setObjectName("rowDue")
+        layout.addWidget(self.date_label)
 
         # Project name label
-        proj_label = QLabel(project_name)
-        proj_label.setFixedWidth(120)
-        proj_label.setFont(QFont(FONT_FAMILY, 11, QFont.Weight.Bold))
-        proj_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(proj_label)
+        self.proj_label = QLabel()
+        self.proj_label.setFixedWidth(120)
+        self.proj_label.setFont(get_font(11, QFont.Weight.Bold))
+        self.proj_label.setObjectName("rowProj")
+        layout.addWidget(self.proj_label)
 
         # Priority label
-        pri_label = QLabel(str(task.priority))
-        pri_label.setFixedWidth(45)
-        pri_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        pri_label.setFont(QFont(FONT_FAMILY, 11))
-        pri_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(pri_label)
+        self.pri_label = QLabel()
+        self.pri_label.setFixedWidth(45)
+        self.pri_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.pri_label.setFont(get_font(11))
+        self.pri_label.setObjectName("rowPri")
+        layout.addWidget(self.pri_label)
 
         # Title label
-        title_label = QLabel(task.title)
-        title_label.setWordWrap(True)
-        title_label.setFont(QFont(FONT_FAMILY, 12))
-        title_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
-        layout.addWidget(title_label, 1)
+        self.title_label = QLabel()
+        self.title_label.setWordWrap(True)
+        self.title_label.setFont(get_font(12))
+        self.title_label.setObjectName("rowTitle")
+        layout.addWidget(self.title_label, 1)
+
+    def set_task(self, task: Task, project_name: str, completed_str):
+        """Point this row at a task (rows are pooled across refreshes).
+
+        completed_str arrives pre-formatted from the query (None when
+        the row lacks a completion timestamp).
+        """
+        self.date_label.setText(completed_str or "—")
+        self.proj_label.setText(project_name)
+        self.pri_label.setText(str(task.priority))
+        self.title_label.setText(task.title)
 
 
 class HistoryWidget(QWidget):
@@ -1453,11 +1937,20 @@ class HistoryWidget(QWidget):
     def __init__(self, db: DatabaseManager, parent=None):
         super().__init__(parent)
         self.db = db
+        self._row_pool: list = []
+        # Parallel to filter_combo rows: entry 0 is the "All Projects" item.
+        self._filter_ids: list = [None]
+        # Debounce filter changes so scrolling through the dropdown with
+        # the keyboard does not refresh the list for every intermediate item
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(50)
+        self._filter_timer.timeout.connect(self._refresh_tasks)
         self._setup_ui()
 
     def _setup_ui(self):
         colors = get_colors()
-        self.setStyleSheet("background: transparent;")
+        self.setStyleSheet(_list_view_qss(colors))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -1465,22 +1958,15 @@ class HistoryWidget(QWidget):
 
         # Filter card
         filter_card = QFrame()
-        filter_card.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['card_bg']};
-                border-radius: 8px;
-            }}
-        """)
+        filter_card.setObjectName("filterCard")
         filter_card.setMaximumHeight(42)
         filter_layout = QHBoxLayout(filter_card)
         filter_layout.setContentsMargins(10, 4, 10, 4)
         filter_layout.setSpacing(8)
 
         filter_label = QLabel("Project:")
-        filter_label.setFont(QFont(FONT_FAMILY, 11))
-        filter_label.setStyleSheet(
-            f"color: {colors['text_primary']}; background: transparent;"
-        )
+        filter_label.setFont(get_font(11))
+        filter_label.setObjectName("filterLabel")
         filter_layout.addWidget(filter_label)
 
         self.filter_combo = QComboBox()
@@ -1494,12 +1980,7 @@ class HistoryWidget(QWidget):
 
         # Column header row
         header_frame = QFrame()
-        header_frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {colors['bg_light']};
-                border-radius: 6px;
-            }}
-        """)
+        header_frame.setObjectName("listHeader")
         header_frame.setFixedHeight(28)
         header_layout = QHBoxLayout(header_frame)
         header_layout.setContentsMargins(8, 2, 8, 2)
@@ -1510,10 +1991,8 @@ class HistoryWidget(QWidget):
             ("Priority", 45, 0), ("Title", 0, 1)
         ]:
             lbl = QLabel(text)
-            lbl.setFont(QFont(FONT_FAMILY, 10, QFont.Weight.Bold))
-            lbl.setStyleSheet(
-                f"color: {colors['text_secondary']}; background: transparent;"
-            )
+            lbl.setFont(get_font(10, QFont.Weight.Bold))
+            lbl.setObjectName("headerLabel")
             if width:
                 lbl.setFixedWidth(width)
             if text == "Priority":
@@ -1543,7 +2022,7 @@ class HistoryWidget(QWidget):
         """)
 
         self.list_container = QWidget()
-        self.list_container.setStyleSheet("background: transparent;")
+        self.list_container.setObjectName("listContainer")
         self.list_layout = QVBoxLayout(self.list_container)
         self.list_layout.setContentsMargins(0, 0, 0, 0)
         self.list_layout.setSpacing(4)
@@ -1554,45 +2033,56 @@ class HistoryWidget(QWidget):
         # Empty state label
         self.empty_label = QLabel("No completed tasks")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setFont(QFont(FONT_FAMILY, 13))
-        self.empty_label.setStyleSheet(
-            f"color: {colors['text_secondary']}; background: transparent;"
-        )
+        self.empty_label.setFont(get_font(13))
+        self.empty_label.setObjectName("emptyLabel")
         self.empty_label.setVisible(False)
         layout.addWidget(self.empty_label)
 
     def refresh(self):
-        """Rebuild filter dropdown (preserving selection) and task list."""
-        current_data = self.filter_combo.currentData()
+        """Rebuild filter dropdown (preserving selection) and task list.
 
-        self.filter_combo.blockSignals(True)
-        self.filter_combo.clear()
-        self.filter_combo.addItem("All Projects", None)
+        Only called while the view is showing; see CalendarWidget.refresh.
+        """
+        current_id = self._selected_project_id()
 
         projects = self.db.get_projects(include_archived=False)
-        selected_index = 0
-        for i, project in enumerate(projects):
-            self.filter_combo.addItem(project.name, project.id)
-            if project.id == current_data:
-                selected_index = i + 1
 
-        self.filter_combo.setCurrentIndex(selected_index)
+        self.filter_combo.blockSignals(True)
+        self.filter_combo.clear()
+        self._filter_ids = [None] + [p.id for p in projects]
+        self.filter_combo.addItems(["All Projects"] + [p.name for p in projects])
+        try:
+            self.filter_combo.setCurrentIndex(self._filter_ids.index(current_id))
+        except ValueError:
+            self.filter_combo.setCurrentIndex(0)
         self.filter_combo.blockSignals(False)
 
         self._refresh_tasks()
 
+    def _selected_project_id(self) -> Optional[int]:
+        """Project id for the current filter selection (None = all)."""
+        index = self.filter_combo.currentIndex()
+        if 0 <= index < len(self._filter_ids):
+            return self._filter_ids[index]
+        return None
+
     def _on_filter_changed(self, _index: int):
-        self._refresh_tasks()
+        self._filter_timer.start()
 
     def _refresh_tasks(self):
-        """Clear and repopulate the task list from DB."""
+        """Clear and repopulate the task list from DB.
+
+        Rows are pooled across refreshes; see CalendarWidget."""
+        # Return existing rows to the pool
         while self.list_layout.count():
             item = self.list_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+            widget = item.widget()
+            if widget is not None:
+                widget.hide()
+                self._row_pool.append(widget)
 
-        project_id = self.filter_combo.currentData()
-        tasks = self.db.get_completed_tasks(project_id)
+        project_id = self._selected_project_id()
+        tasks = self.db.get_completed_tasks_named(project_id)
 
         if not tasks:
             self.empty_label.setVisible(True)
@@ -1602,11 +2092,18 @@ class HistoryWidget(QWidget):
         self.empty_label.setVisible(False)
         self.scroll.setVisible(True)
 
-        projects = self.db.get_projects(include_archived=False)
-        proj_names = {p.id: p.name for p in projects}
-
-        with batch_update(self.list_container):
-            for task in tasks:
-                name = proj_names.get(task.project_id, "?")
-                item = HistoryTaskItem(task, name)
-                self.list_layout.addWidget(item)
+        # See CalendarWidget._refresh_tasks for the layout-disable note
+        self.list_layout.setEnabled(False)
+        try:
+            with batch_update(self.list_container):
+                for task, name, completed_str in tasks:
+                    if self._row_pool:
+                        row = self._row_pool.pop()
+                    else:
+                        row = HistoryTaskItem(self.list_container)
+                    row.set_task(task, name, completed_str)
+                    self.list_layout.addWidget(row)
+                    row.show()
+        finally:
+            self.list_layout.setEnabled(True)
+            self.list_layout.activate()